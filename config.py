@@ -10,8 +10,10 @@ ALARM_FILE = ETIME_DIR / "alarm.aiff"
 SUCCESS_SOUND_FILE = ETIME_DIR / "success.aiff"
 
 # Timer constants
-TIMER_INTERVAL_MS = 100  # 100ms tick for smooth updates
-TIMER_INCREMENT_S = 0.1  # 0.1 second increment per tick
+TIMER_INTERVAL_MS = 1000  # Longest gap between ticks (they also land on each running task's second boundary)
+
+# Persistence
+SAVE_DEBOUNCE_MS = 500  # Coalesce active.json writes within this window
 
 # Window positioning
 WINDOW_MARGIN_X = 10  # Small margin from edge
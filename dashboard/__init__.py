@@ -20,8 +20,6 @@ def _is_process_alive(pid: int) -> bool:
 
 def _read_pid() -> int | None:
     """Read PID from pid file, return None if missing or stale."""
-    if not DASHBOARD_PID_FILE.exists():
-        return None
     try:
         pid = int(DASHBOARD_PID_FILE.read_text().strip())
         if _is_process_alive(pid):
@@ -29,6 +27,8 @@ def _read_pid() -> int | None:
         # Stale pid file
         DASHBOARD_PID_FILE.unlink(missing_ok=True)
         return None
+    except FileNotFoundError:
+        return None
     except (ValueError, OSError):
         DASHBOARD_PID_FILE.unlink(missing_ok=True)
         return None
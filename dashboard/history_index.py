@@ -0,0 +1,119 @@
+"""Incremental per-date index over the append-only history.jsonl."""
+
+import os
+import threading
+from pathlib import Path
+
+import orjson
+
+
+class HistoryIndex:
+    """Maps completion dates to the byte ranges of their history lines.
+
+    history.jsonl only ever grows (except for undo, which truncates the last
+    line), so each refresh parses just the bytes appended since the previous
+    one. Looking up a day then reads only that day's lines via os.pread.
+    The last indexed line is re-read on each refresh, so an undo followed by
+    a new append (same size or larger) is still caught and triggers a rebuild.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._reset(None)
+
+    def _reset(self, inode: int | None) -> None:
+        """Drop all indexed entries."""
+        self._inode = inode
+        self._indexed_size = 0
+        self._tail = b""  # Bytes of the last indexed line, ending at _indexed_size
+        self._offsets: dict[str, list[tuple[int, int]]] = {}
+
+    def _tail_matches(self) -> bool:
+        """Check that the last indexed line is still on disk unchanged."""
+        if not self._tail:
+            return True
+        try:
+            fd = os.open(self.path, os.O_RDONLY)
+        except OSError:
+            return False
+        try:
+            return os.pread(fd, len(self._tail), self._indexed_size - len(self._tail)) == self._tail
+        except OSError:
+            return False
+        finally:
+            os.close(fd)
+
+    def refresh(self) -> None:
+        """Index any lines appended since the last refresh."""
+        with self._lock:
+            try:
+                st = self.path.stat()
+            except OSError:
+                self._reset(None)
+                return
+
+            # Replaced or truncated (undo) file, possibly already regrown past
+            # the indexed size by a new append: rebuild from scratch
+            if (st.st_ino != self._inode or st.st_size < self._indexed_size
+                    or not self._tail_matches()):
+                self._reset(st.st_ino)
+            if st.st_size == self._indexed_size:
+                return
+
+            with open(self.path, "rb") as f:
+                f.seek(self._indexed_size)
+                data = f.read(st.st_size - self._indexed_size)
+            self._index_chunk(data)
+
+    def _index_chunk(self, data: bytes) -> None:
+        """Record date -> (offset, length) for each complete line in data."""
+        base = self._indexed_size
+        pos = 0
+        last_start = None
+        while pos < len(data):
+            end = data.find(b"\n", pos)
+            line_end = len(data) if end == -1 else end
+            try:
+                t = orjson.loads(data[pos:line_end]) if line_end > pos else None
+            except orjson.JSONDecodeError:
+                if end == -1:
+                    break  # Trailing line may still be mid-write; retry later
+                t = None
+            if isinstance(t, dict):
+                day = (t.get("completed_at") or t.get("created_at") or "")[:10]
+                self._offsets.setdefault(day, []).append((base + pos, line_end - pos))
+            if line_end > pos:
+                last_start = pos
+            pos = line_end + 1
+        end = min(pos, len(data))
+        self._indexed_size = base + end
+        # Keep the last non-empty line plus any blank lines after it
+        if last_start is None:
+            self._tail += data[:end]
+        else:
+            self._tail = data[last_start:end]
+
+    def tasks_for(self, day: str) -> list[dict]:
+        """Return history tasks whose completion date is day (YYYY-MM-DD)."""
+        for _ in range(2):
+            self.refresh()
+            with self._lock:
+                entries = list(self._offsets.get(day, ()))
+            if not entries:
+                return []
+            try:
+                return self._read_entries(entries)
+            except (OSError, orjson.JSONDecodeError):
+                # File changed underneath us: rebuild and read again
+                with self._lock:
+                    self._reset(None)
+        return []
+
+    def _read_entries(self, entries: list[tuple[int, int]]) -> list[dict]:
+        """Read and decode the history lines at the given (offset, length) ranges."""
+        fd = os.open(self.path, os.O_RDONLY)
+        try:
+            return [orjson.loads(os.pread(fd, length, offset)) for offset, length in entries]
+        finally:
+            os.close(fd)
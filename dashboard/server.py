@@ -1,13 +1,17 @@
 """Flask dashboard server for etime."""
 
 import argparse
-import json
+import logging
+import operator
 import os
 from datetime import datetime, date
 from pathlib import Path
 from typing import Optional
 
-from flask import Flask, jsonify, render_template, request
+import orjson
+from flask import Flask, Response, render_template, request
+
+from history_index import HistoryIndex
 
 # Resolve paths without importing config (avoids PyQt6 dependency chain)
 ETIME_DIR = Path.home() / ".etime"
@@ -15,123 +19,156 @@ HISTORY_FILE = ETIME_DIR / "history.jsonl"
 ACTIVE_FILE = ETIME_DIR / "active.json"
 DISTRACTION_FILE = Path.home() / "Dev" / "DistractionCount" / "distraction_count.txt"
 
+# Large read buffer for line-oriented data files (fewer read syscalls)
+_READ_BUFFER_SIZE = 1 << 20
+
 app = Flask(__name__)
 
 # Set via CLI arg or default to today
 _date_filter: Optional[date] = None
 
+# Kept warm across requests; only newly appended lines are parsed
+_history_index = HistoryIndex(HISTORY_FILE)
 
-def _load_history() -> list[dict]:
-    """Load all tasks from history.jsonl."""
-    if not HISTORY_FILE.exists():
-        return []
-    tasks = []
-    with open(HISTORY_FILE, "r") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                tasks.append(json.loads(line))
-            except json.JSONDecodeError:
-                continue
-    return tasks
+# Last /api/data response as (key, body), keyed on (data file mtimes, target
+# date). Replaced as one tuple so concurrent request threads never see a key
+# paired with another response's body
+_response_cache: tuple = (None, b"")
+
+# Distraction timestamps grouped by date as (mtime_ns, days), valid for one
+# distraction file mtime; replaced as one tuple (see _response_cache)
+_distraction_cache: tuple = (None, {})
+
+
+def _mtime_ns(path: Path) -> int:
+    """Return the file's mtime in nanoseconds, or 0 if it doesn't exist."""
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _load_history(target: date) -> list[dict]:
+    """Load tasks completed on the target date from history.jsonl."""
+    return _history_index.tasks_for(target.isoformat())
 
 
 def _load_active() -> list[dict]:
     """Load active tasks from active.json."""
-    if not ACTIVE_FILE.exists():
-        return []
     try:
-        with open(ACTIVE_FILE, "r") as f:
-            data = json.load(f)
+        with open(ACTIVE_FILE, "rb") as f:
+            data = orjson.loads(f.read())
         return data if isinstance(data, list) else []
-    except (json.JSONDecodeError, OSError):
+    except (orjson.JSONDecodeError, OSError):
         return []
 
 
-def _filter_by_date(tasks: list[dict], target: date) -> list[dict]:
-    """Filter tasks to those completed on the target date."""
-    filtered = []
-    for t in tasks:
-        completed_at = t.get("completed_at") or t.get("created_at", "")
-        try:
-            dt = datetime.fromisoformat(completed_at)
-            if dt.date() == target:
-                filtered.append(t)
-        except (ValueError, TypeError):
-            continue
-    return filtered
-
-
 def _load_distractions(target: date) -> dict:
     """Load distraction timestamps for the target date."""
-    if not DISTRACTION_FILE.exists():
-        return {"count": 0, "timestamps": []}
+    timestamps = _distractions_by_day().get(target.isoformat().encode(), [])
+    return {"count": len(timestamps), "timestamps": timestamps}
 
-    timestamps = []
-    try:
-        with open(DISTRACTION_FILE, "r") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    dt = datetime.strptime(line, "%Y-%m-%d %H:%M:%S")
-                    if dt.date() == target:
-                        timestamps.append(dt.strftime("%H:%M:%S"))
-                except ValueError:
-                    continue
-    except OSError:
-        pass
 
-    return {"count": len(timestamps), "timestamps": timestamps}
+def _distractions_by_day() -> dict[bytes, list[str]]:
+    """Group distraction timestamps by date, re-reading only when the file changes.
 
+    The log is written by an external tool as one "YYYY-MM-DD HH:MM:SS" line
+    per event, so it is sharded by date in memory rather than on disk.
+    """
+    global _distraction_cache
+    mtime_ns = _mtime_ns(DISTRACTION_FILE)
+    cached_mtime_ns, cached_days = _distraction_cache
+    if cached_mtime_ns == mtime_ns:
+        return cached_days
 
-def _compute_stats(tasks: list[dict], distractions: dict) -> dict:
-    """Compute summary statistics from a list of completed tasks."""
-    total_tasks = len(tasks)
-    total_elapsed = sum(t.get("elapsed_seconds", 0) for t in tasks)
-    total_estimated = sum(t.get("estimated_seconds", 0) for t in tasks)
+    days: dict[bytes, list[str]] = {}
+    if mtime_ns:
+        try:
+            with open(DISTRACTION_FILE, "rb", buffering=_READ_BUFFER_SIZE) as f:
+                for line in f:
+                    if len(line) >= 19 and line[10:11] == b" ":
+                        days.setdefault(line[:10], []).append(line[11:19].decode())
+        except OSError:
+            pass
+
+    _distraction_cache = (mtime_ns, days)
+    return days
+
+
+def _summarize_day(tasks: list[dict], distractions: dict) -> tuple[dict, list[dict]]:
+    """Format completed tasks for the API and compute their summary stats.
 
-    # Calibration: how accurate are estimates?
-    accuracies = []
+    Both are built in the same pass; the stats reuse the fields already
+    pulled out for each formatted row.
+    """
+    rows = []
+    total_tasks = len(tasks)
+    total_elapsed = 0
+    total_estimated = 0
+    accuracy_sum = 0.0
+    accuracy_count = 0  # Calibration: how accurate are estimates?
+    ambitious_tasks = 0
+    ambitious_within = 0
+
+    # Single pass over the day's tasks
     for t in tasks:
-        est = t.get("estimated_seconds", 0)
-        elap = t.get("elapsed_seconds", 0)
+        row = _format_task_for_api(t)
+        rows.append(row)
+        est = row["estimated_seconds"]
+        elap = t.get("elapsed_seconds", 0)  # Row value is rounded
+        total_elapsed += elap
+        total_estimated += est
         if est > 0:
-            accuracies.append(elap / est)
-    avg_accuracy = sum(accuracies) / len(accuracies) if accuracies else 0
+            accuracy_sum += elap / est
+            accuracy_count += 1
+        if row["ambitious_seconds"] is not None:
+            ambitious_tasks += 1
+            if row["within_ambitious"]:
+                ambitious_within += 1
 
-    # Ambitious stats
-    ambitious_tasks = [t for t in tasks if t.get("ambitious_seconds") is not None]
-    ambitious_within = [
-        t for t in ambitious_tasks
-        if t.get("elapsed_seconds", 0) <= (t.get("ambitious_seconds") or 0)
-    ]
+    avg_accuracy = accuracy_sum / accuracy_count if accuracy_count else 0
 
-    return {
+    stats = {
         "total_tasks": total_tasks,
         "total_elapsed_seconds": round(total_elapsed, 1),
         "total_estimated_seconds": round(total_estimated, 1),
         "avg_accuracy": round(avg_accuracy, 3),
-        "ambitious_tasks": len(ambitious_tasks),
-        "ambitious_within": len(ambitious_within),
+        "ambitious_tasks": ambitious_tasks,
+        "ambitious_within": ambitious_within,
         "ambitious_rate": round(
-            len(ambitious_within) / len(ambitious_tasks), 3
+            ambitious_within / ambitious_tasks, 3
         ) if ambitious_tasks else 0,
         "distractions": distractions["count"],
     }
+    return stats, rows
+
+
+# Fields every task written by current etime versions has, in unpack order
+_TASK_FIELDS = operator.itemgetter(
+    "name", "elapsed_seconds", "estimated_seconds", "ambitious_seconds",
+    "completed_at", "created_at", "work_intervals", "parent_task_id", "id",
+)
 
 
 def _format_task_for_api(t: dict) -> dict:
     """Format a task dict for the API response."""
-    elapsed = t.get("elapsed_seconds", 0)
-    estimated = t.get("estimated_seconds", 0)
-    ambitious = t.get("ambitious_seconds")
+    try:
+        (name, elapsed, estimated, ambitious, completed_at, created_at,
+         work_intervals, parent_task_id, task_id) = _TASK_FIELDS(t)
+    except KeyError:
+        # Old records predate some fields; fall back to per-key defaults
+        name = t.get("name", "")
+        elapsed = t.get("elapsed_seconds", 0)
+        estimated = t.get("estimated_seconds", 0)
+        ambitious = t.get("ambitious_seconds")
+        completed_at = t.get("completed_at", "")
+        created_at = t.get("created_at", "")
+        work_intervals = t.get("work_intervals", [])
+        parent_task_id = t.get("parent_task_id")
+        task_id = t.get("id", "")
 
     return {
-        "name": t.get("name", ""),
+        "name": name,
         "elapsed_seconds": round(elapsed, 1),
         "estimated_seconds": estimated,
         "ambitious_seconds": ambitious,
@@ -140,11 +177,11 @@ def _format_task_for_api(t: dict) -> dict:
         "within_ambitious": (
             ambitious is not None and elapsed <= ambitious
         ),
-        "completed_at": t.get("completed_at", ""),
-        "created_at": t.get("created_at", ""),
-        "work_intervals": t.get("work_intervals", []),
-        "parent_task_id": t.get("parent_task_id"),
-        "id": t.get("id", ""),
+        "completed_at": completed_at,
+        "created_at": created_at,
+        "work_intervals": work_intervals,
+        "parent_task_id": parent_task_id,
+        "id": task_id,
     }
 
 
@@ -165,6 +202,7 @@ def index():
 @app.route("/api/data")
 def api_data():
     """Return all dashboard data as JSON."""
+    global _response_cache
     date_param = request.args.get("date")
     if date_param:
         try:
@@ -174,19 +212,31 @@ def api_data():
     else:
         target = _date_filter or date.today()
 
-    history = _load_history()
-    day_tasks = _filter_by_date(history, target)
+    key = (
+        _mtime_ns(HISTORY_FILE),
+        _mtime_ns(ACTIVE_FILE),
+        _mtime_ns(DISTRACTION_FILE),
+        target,
+    )
+    cached_key, cached_body = _response_cache
+    if cached_key == key:
+        return Response(cached_body, mimetype="application/json")
+
+    day_tasks = _load_history(target)
     active = _load_active()
     distractions = _load_distractions(target)
-    stats = _compute_stats(day_tasks, distractions)
+    stats, day_rows = _summarize_day(day_tasks, distractions)
 
-    return jsonify({
+    payload = {
         "date": target.isoformat(),
         "stats": stats,
-        "tasks": [_format_task_for_api(t) for t in day_tasks],
+        "tasks": day_rows,
         "active_tasks": [_format_task_for_api(t) for t in active],
         "distractions": distractions,
-    })
+    }
+    body = orjson.dumps(payload)
+    _response_cache = (key, body)
+    return Response(body, mimetype="application/json")
 
 
 def main():
@@ -205,6 +255,9 @@ def main():
     pid_file = ETIME_DIR / "dashboard.pid"
     pid_file.write_text(str(os.getpid()))
 
+    # Per-request access logging is pure overhead (stdout goes to /dev/null)
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+
     try:
         app.run(host="127.0.0.1", port=args.port, debug=False)
     finally:
@@ -33,7 +33,6 @@ class HotkeyManager:
         self.callbacks: Dict[tuple[int, bool], Callable] = {}
         self.tap = None
         self.run_loop_source = None
-        self._health_check_count: int = 0
 
     def register(self, keycode: int, callback: Callable, shift: bool = False) -> None:
         """
@@ -116,24 +115,14 @@ class HotkeyManager:
         CGEventTapEnable(self.tap, True)
         return True
 
-    def check_and_repair(self) -> None:
+    def ensure_enabled(self) -> None:
         """
-        Periodic health check for the event tap.
-        Call this every few seconds to detect and recover from
-        disabled taps (e.g. caused by Spotify or other apps).
-        Also proactively recreates the tap every ~60s to recover
-        from silent failures where the tap appears enabled but
-        stops firing callbacks.
+        Re-enable or recreate the event tap if it is missing or disabled.
+        Cheap enough to call on every app activation.
         """
-        self._health_check_count += 1
-
-        # Proactive full recreation every ~60s (20 checks * 3s interval)
-        if self._health_check_count % 20 == 0:
-            self.stop()
-            if self._create_tap():
-                print("Event tap proactively recreated")
-            else:
-                print("ERROR: Failed to proactively recreate event tap")
+        # A tap can't be (re)created without Accessibility permission
+        if not AXIsProcessTrusted():
+            print("WARNING: Accessibility permission revoked - hotkeys unavailable")
             return
 
         if not self.tap:
@@ -145,7 +134,7 @@ class HotkeyManager:
             return
 
         if not CGEventTapIsEnabled(self.tap):
-            print("WARNING: Event tap found disabled during health check - re-enabling")
+            print("WARNING: Event tap found disabled - re-enabling")
             CGEventTapEnable(self.tap, True)
 
             # Verify it actually re-enabled
@@ -179,34 +168,28 @@ class HotkeyManager:
             print(f"WARNING: Event tap disabled by {reason} - re-enabling immediately")
             if self.tap:
                 CGEventTapEnable(self.tap, True)
+                # Recreating the tap from inside its own callback isn't safe;
+                # ensure_enabled() does that on the next app activation
+                if not CGEventTapIsEnabled(self.tap):
+                    print("WARNING: Event tap re-enable failed - will recreate on next activation")
             return event
 
         try:
-            # Get keycode
-            keycode = CGEventGetIntegerValueField(event, kCGKeyboardEventKeycode)
-
-            # Get modifier flags
+            # Fast path: most keystrokes lack our modifiers, so check the flags
+            # before any other bridge call or dict lookup
             flags = CGEventGetFlags(event)
+            if (flags & HOTKEY_MODIFIERS) != HOTKEY_MODIFIERS:
+                return event
 
-
-            # Check if our modifiers are pressed
-            # Mask to only the modifiers we care about
-            relevant_flags = flags & (
-                kCGEventFlagMaskControl |
-                kCGEventFlagMaskAlternate |
-                kCGEventFlagMaskCommand
-            )
-
-            # Check if this is one of our hotkeys
-            if relevant_flags == HOTKEY_MODIFIERS:
-                shift_pressed = bool(flags & kCGEventFlagMaskShift)
-                key = (keycode, shift_pressed)
-                if key in self.callbacks:
-                    try:
-                        self.callbacks[key]()
-                    except Exception as e:
-                        print(f"Error in hotkey callback for keycode {keycode}: {e}")
-                    return None
+            keycode = CGEventGetIntegerValueField(event, kCGKeyboardEventKeycode)
+            shift_pressed = bool(flags & kCGEventFlagMaskShift)
+            callback = self.callbacks.get((keycode, shift_pressed))
+            if callback is not None:
+                try:
+                    callback()
+                except Exception as e:
+                    print(f"Error in hotkey callback for keycode {keycode}: {e}")
+                return None
 
         except Exception as e:
             print(f"Error in event callback: {e}")
@@ -3,6 +3,7 @@
 
 import sys
 from datetime import datetime
+from types import MappingProxyType
 from PyQt6.QtWidgets import QApplication, QMessageBox, QDialog, QVBoxLayout, QLabel
 from PyQt6.QtCore import QObject, QTimer, Qt
 from PyQt6.QtGui import QFont
@@ -12,18 +13,18 @@ import objc
 
 from models import Task, TaskState
 from typing import Optional
-from storage import ensure_etime_dir, load_active_tasks, save_active_tasks, append_to_history, remove_last_from_history
+from storage import ensure_etime_dir, load_active_tasks, remove_last_from_history, StorageWriter
 from timer_engine import TimerEngine
 from overlay import OverlayWindow
 from task_dialog import TaskDialog
 from hotkeys import HotkeyManager
+from config import SAVE_DEBOUNCE_MS
 from config import KEY_N, KEY_P, KEY_C, KEY_Q, KEY_S, KEY_U, KEY_H, KEY_T, KEY_UP, KEY_DOWN, KEY_A, KEY_LEFT, KEY_RIGHT
 from sounds import play_alarm_loop, stop_alarm, play_success_sound, play_ambitious_success_sound
-import dashboard
 
 
 class SleepObserver(NSObject):
-    """Observes macOS sleep/wake notifications via NSWorkspace."""
+    """Observes macOS sleep/wake (and app activation) notifications via NSWorkspace."""
 
     def init(self):
         self = objc.super(SleepObserver, self).init()
@@ -31,6 +32,7 @@ class SleepObserver(NSObject):
             return None
         self.on_sleep = None
         self.on_wake = None
+        self.on_app_activated = None
         return self
 
     def handleSleep_(self, notification):
@@ -41,6 +43,10 @@ class SleepObserver(NSObject):
         if self.on_wake:
             self.on_wake()
 
+    def handleAppActivated_(self, notification):
+        if self.on_app_activated:
+            self.on_app_activated()
+
 
 class HelpDialog(QDialog):
     """Simple popup showing all hotkeys."""
@@ -103,6 +109,9 @@ class AppController(QObject):
         self.last_created_task: Optional[Task] = None  # For undo creation
         self._auto_paused_tasks: set = set()  # Task IDs paused due to sleep
         self.show_all_mode: bool = False  # Toggle visibility of stashed tasks
+        self._tasks_by_id: dict = {}  # Task ID -> Task (mirrors self.tasks)
+        self._tasks_by_id_view = MappingProxyType(self._tasks_by_id)  # Live read-only view
+        self._index_by_id: dict = {}  # Task ID -> position in self.tasks
 
         # Initialize
         self._initialize()
@@ -114,22 +123,36 @@ class AppController(QObject):
 
         # Load active tasks
         self.tasks = load_active_tasks()
+        self._reindex()
         print(f"Loaded {len(self.tasks)} active tasks")
 
+        # Debounced saves: state changes within SAVE_DEBOUNCE_MS share one write
+        self._writer = StorageWriter()
+        self._save_timer = QTimer()
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(SAVE_DEBOUNCE_MS)
+        self._save_timer.timeout.connect(self._flush_save)
+
         # Create overlay window
         self.overlay = OverlayWindow(self.tasks, self)
         self.overlay.show()
 
         # Create timer engine
         self.timer_engine = TimerEngine(self.tasks)
-        self.timer_engine.tick.connect(self._on_timer_tick)
-        self.timer_engine.alarm.connect(self._on_alarm)
+        # Queued so tick work is drained by the event loop instead of running
+        # inside the engine's timer callback
+        queued = Qt.ConnectionType.QueuedConnection
+        self.timer_engine.tick.connect(self._on_timer_tick, queued)
+        self.timer_engine.alarms_fired.connect(self._on_alarms_fired, queued)
         self.timer_engine.start()
 
         # Create task dialog (reused for each new task)
         self.task_dialog = TaskDialog()
         self.task_dialog.task_submitted.connect(self._on_task_submitted)
 
+        # Shared workspace singleton, fetched once (new_task reads it per keypress)
+        self._nsworkspace = NSWorkspace.sharedWorkspace()
+
         # Setup hotkey manager
         self.hotkey_manager = HotkeyManager()
         self.hotkey_manager.register(KEY_N, self.new_task)
@@ -158,10 +181,9 @@ class AppController(QObject):
             )
             sys.exit(1)
 
-        # Periodic health check for event tap (recovers from Spotify-style conflicts)
-        self.hotkey_health_timer = QTimer()
-        self.hotkey_health_timer.timeout.connect(self.hotkey_manager.check_and_repair)
-        self.hotkey_health_timer.start(3000)  # Check every 3 seconds
+        # No periodic timer watches the event tap: the timer engine is the only
+        # repeating driver. The tap re-enables itself from its own disabled
+        # callback, and app activation and wake check it below.
 
         # Setup help dialog (kept as instance to prevent GC)
         self.help_dialog = HelpDialog()
@@ -170,52 +192,123 @@ class AppController(QObject):
         self._sleep_observer = SleepObserver.alloc().init()
         self._sleep_observer.on_sleep = self._on_sleep
         self._sleep_observer.on_wake = self._on_wake
-        nc = NSWorkspace.sharedWorkspace().notificationCenter()
+        # Another app taking focus is when conflicting taps (e.g. Spotify) tend
+        # to disable ours, so check the tap then
+        self._sleep_observer.on_app_activated = self.hotkey_manager.ensure_enabled
+        nc = self._nsworkspace.notificationCenter()
         nc.addObserver_selector_name_object_(
             self._sleep_observer, 'handleSleep:',
             'NSWorkspaceWillSleepNotification', None)
         nc.addObserver_selector_name_object_(
             self._sleep_observer, 'handleWake:',
             'NSWorkspaceDidWakeNotification', None)
+        nc.addObserver_selector_name_object_(
+            self._sleep_observer, 'handleAppActivated:',
+            'NSWorkspaceDidActivateApplicationNotification', None)
         print("Sleep/wake observer registered")
 
-        # Launch dashboard server
-        dashboard.launch()
+        # Launch dashboard server once the event loop is running, so the
+        # subprocess spawn doesn't delay the first overlay paint
+        QTimer.singleShot(0, self._launch_dashboard)
 
         print("Application initialized successfully")
 
-    def _on_timer_tick(self):
-        """Handle timer tick: update overlay display."""
-        self.overlay.update_display()
+    def _launch_dashboard(self):
+        """Start the dashboard server (imported here; nothing else needs it)."""
+        import dashboard
+        dashboard.launch()
 
-    def _on_alarm(self, task_id: str, level: int):
-        """Handle alarm trigger."""
-        # Find task
-        task = next((t for t in self.tasks if t.id == task_id), None)
-        if not task:
-            return
+    def _reindex(self):
+        """Rebuild the id lookups after self.tasks changed."""
+        # Refilled in place so the read-only view handed out stays current
+        self._tasks_by_id.clear()
+        self._tasks_by_id.update((t.id, t) for t in self.tasks)
+        self._index_by_id = {t.id: i for i, t in enumerate(self.tasks)}
+        if self.timer_engine is not None:
+            self.timer_engine.invalidate()
+
+    def _insert_task(self, index: int, task: Task):
+        """Insert a task into self.tasks (shared with overlay/engine) and reindex."""
+        self.tasks.insert(index, task)
+        self._reindex()
+
+    def _remove_task(self, task: Task):
+        """Remove a task from self.tasks and reindex."""
+        self.tasks.remove(task)
+        self._reindex()
+
+    def _schedule_save(self):
+        """Request a save of active tasks (written within SAVE_DEBOUNCE_MS).
+
+        The timer is not restarted while pending, so a burst of changes is
+        coalesced into one write without postponing it indefinitely.
+        """
+        if not self._save_timer.isActive():
+            self._save_timer.start()
+
+    def _flush_save(self):
+        """Hand the current task list to the background writer now."""
+        self._save_timer.stop()
+        self._writer.save_active(self.tasks)
 
-        print(f"Alarm triggered for task '{task.name}' at level {level}x")
+    def shutdown(self):
+        """Write any pending save before the app exits."""
+        if self._save_timer.isActive():
+            self._flush_save()
+        self._writer.flush()
 
-        # Track this alarm
-        self.active_alarms.add(task_id)
+    def _on_timer_tick(self):
+        """Handle timer tick: refresh the ongoing tasks' widgets."""
+        # Nothing to paint while hidden; toggle_overlay refreshes on show
+        if not self.overlay_visible:
+            return
+
+        # Only ongoing tasks advance; state changes refresh the rest. Each
+        # widget skips the refresh itself when its shown second is unchanged
+        for task in self.timer_engine.ongoing_tasks():
+            self.overlay.update_task_display(task.id)
+
+    def _on_alarms_fired(self, fired: list):
+        """Handle the alarms triggered in one tick, as [(task_id, level), ...]."""
+        had_alarms = bool(self.active_alarms)
+        triggered = False
+        for task_id, level in fired:
+            task = self._tasks_by_id.get(task_id)
+            if not task:
+                continue
+            # Delivery is queued; the task may have been paused/completed meanwhile.
+            # The engine already raised last_alarm_level, so reset it (as
+            # pause_task does for alarmed tasks) to re-fire on resume
+            if task.state is not TaskState.ONGOING:
+                task.last_alarm_level = 0
+                continue
+
+            print(f"Alarm triggered for task '{task.name}' at level {level}x")
+
+            # Track this alarm
+            self.active_alarms.add(task_id)
+            triggered = True
+
+        if not triggered:
+            return
 
         # Play looping alarm if not already playing
-        if len(self.active_alarms) == 1:  # First alarm
+        if not had_alarms:  # First alarm
             play_alarm_loop()
 
-        # Update overlay to show bolded task
-        self.overlay.update_display()
+        # Update overlay to show bolded task (caught up on show if hidden)
+        if self.overlay_visible:
+            self.overlay.update_display()
 
-        # Save state (alarm level was updated in timer engine)
-        save_active_tasks(self.tasks)
+        # Save state (alarm levels were updated in timer engine)
+        self._schedule_save()
 
     def new_task(self):
         """Handle new task hotkey."""
         print("New task hotkey pressed")
 
         # Store previously focused app for focus restoration
-        self.previous_app = NSWorkspace.sharedWorkspace().frontmostApplication()
+        self.previous_app = self._nsworkspace.frontmostApplication()
 
         self.task_dialog.reset()
 
@@ -252,25 +345,23 @@ class AppController(QObject):
 
         # Determine insertion position: right after parent if subtask, else end
         if parent_task_id:
-            parent_idx = next(
-                (i for i, t in enumerate(self.tasks) if t.id == parent_task_id), None
-            )
+            parent_idx = self._index_by_id.get(parent_task_id)
             if parent_idx is not None:
                 # Insert right after parent (and after any existing subtasks of that parent)
                 insert_idx = parent_idx + 1
                 while (insert_idx < len(self.tasks)
                        and self.tasks[insert_idx].parent_task_id == parent_task_id):
                     insert_idx += 1
-                self.tasks.insert(insert_idx, task)
+                self._insert_task(insert_idx, task)
                 self.overlay.insert_task(task, insert_idx)
                 new_index = insert_idx
             else:
                 # Parent not found, append at end
-                self.tasks.append(task)
+                self._insert_task(len(self.tasks), task)
                 self.overlay.add_task(task)
                 new_index = len(self.tasks) - 1
         else:
-            self.tasks.append(task)
+            self._insert_task(len(self.tasks), task)
             self.overlay.add_task(task)
             new_index = len(self.tasks) - 1
 
@@ -298,8 +389,8 @@ class AppController(QObject):
         self.last_completed_task = None  # New action clears old undo
 
         # Save
-        save_active_tasks(self.tasks)
-        print("Task saved successfully")
+        self._schedule_save()
+        print("Task save scheduled")
 
         # Restore focus to previous app
         if self.previous_app:
@@ -314,7 +405,7 @@ class AppController(QObject):
             print("No task focused")
             return
 
-        if task.state == TaskState.ONGOING:
+        if task.state is TaskState.ONGOING:
             # Currently running, so pause it
             self.pause_task()
         else:
@@ -332,6 +423,7 @@ class AppController(QObject):
 
         # Set state to ONGOING
         task.state = TaskState.ONGOING
+        self.timer_engine.invalidate()
 
         # Set started_at if not already set
         if not task.started_at:
@@ -343,7 +435,7 @@ class AppController(QObject):
         self.overlay.update_display()
 
         # Save
-        save_active_tasks(self.tasks)
+        self._schedule_save()
 
     def pause_task(self):
         """Handle pause task hotkey."""
@@ -364,15 +456,18 @@ class AppController(QObject):
                 print("Alarm silenced due to pause")
 
         task.end_interval()
+        # Ticks only land on second boundaries; persist the exact total
+        task.elapsed_seconds = task.compute_elapsed()
 
         # Set state to PAUSED
         task.state = TaskState.PAUSED
+        self.timer_engine.invalidate()
 
         # Update display
         self.overlay.update_display()
 
         # Save
-        save_active_tasks(self.tasks)
+        self._schedule_save()
 
     def complete_task(self):
         """Handle complete task hotkey."""
@@ -404,16 +499,18 @@ class AppController(QObject):
         self.last_created_task = None  # New action clears old undo
 
         task.end_interval()
+        # Exact total for history and the ambitious check (ticks lag up to 1 s)
+        task.elapsed_seconds = task.compute_elapsed()
 
         # Set state to COMPLETED
         task.state = TaskState.COMPLETED
         task.completed_at = datetime.now().isoformat()
 
-        # Append to history
-        append_to_history(task)
+        # Append to history (written in the background, in order with saves)
+        self._writer.append_history(task)
 
         # Remove from active tasks
-        self.tasks.remove(task)
+        self._remove_task(task)
 
         # Update focus index if needed (use visible task count)
         visible_count = len(self.overlay._visible_tasks())
@@ -437,7 +534,7 @@ class AppController(QObject):
 
         # Remove from overlay with appropriate animation
         def on_removed():
-            save_active_tasks(self.tasks)
+            self._flush_save()
             self.overlay.update_display()
 
         if completed_in_ambitious:
@@ -463,6 +560,11 @@ class AppController(QObject):
         # Update overlay to remove bold from tasks
         self.overlay.update_display()
 
+    @property
+    def tasks_by_id(self) -> MappingProxyType:
+        """Read-only view of the active tasks keyed by ID (tracks reindexing)."""
+        return self._tasks_by_id_view
+
     def is_task_alarmed(self, task_id: str) -> bool:
         """Check if a task has an active alarm."""
         return task_id in self.active_alarms
@@ -474,6 +576,7 @@ class AppController(QObject):
             self.overlay_visible = False
             print("Overlay hidden")
         else:
+            self.overlay.update_display()  # Catch up on ticks skipped while hidden
             self.overlay.show()
             self.overlay.position_at_top_right()  # Reposition when showing
             self.overlay_visible = True
@@ -498,8 +601,8 @@ class AppController(QObject):
             task.end_interval()
 
         # Remove from task list and overlay
-        if task in self.tasks:
-            self.tasks.remove(task)
+        if task.id in self._tasks_by_id:
+            self._remove_task(task)
         self.overlay.remove_task(task.id)
 
         # Adjust focus
@@ -510,7 +613,7 @@ class AppController(QObject):
             self.overlay.focused_index = -1
         self.overlay.update_display()
 
-        save_active_tasks(self.tasks)
+        self._schedule_save()
         self.last_created_task = None
         print(f"Task '{task.name}' removed")
 
@@ -519,7 +622,8 @@ class AppController(QObject):
         task = self.last_completed_task
         print(f"Undoing completion of: {task.name}")
 
-        # Remove from history
+        # Remove from history (after any queued append has landed)
+        self._writer.flush()
         if not remove_last_from_history(task.id):
             print("Failed to remove from history - undo aborted")
             return
@@ -531,7 +635,7 @@ class AppController(QObject):
 
         # Re-insert at original position (or end if index is now invalid)
         insert_index = min(self.last_completed_index, len(self.tasks))
-        self.tasks.insert(insert_index, task)
+        self._insert_task(insert_index, task)
 
         # Re-add to overlay
         self.overlay.insert_task(task, insert_index)
@@ -546,7 +650,7 @@ class AppController(QObject):
         self.overlay.update_display()
 
         # Save active tasks
-        save_active_tasks(self.tasks)
+        self._schedule_save()
 
         # Clear undo state
         self.last_completed_task = None
@@ -576,7 +680,7 @@ class AppController(QObject):
             task.parent_task_id = parent.id
             print(f"'{task.name}' is now a subtask of '{parent.name}'")
 
-        save_active_tasks(self.tasks)
+        self._schedule_save()
         self.overlay.update_display()
 
     def stash_task(self):
@@ -585,7 +689,7 @@ class AppController(QObject):
         if not task or task.is_stashed:
             return
 
-        if task.state == TaskState.ONGOING:
+        if task.state is TaskState.ONGOING:
             print("Cannot stash an ongoing task — pause it first")
             return
 
@@ -605,7 +709,7 @@ class AppController(QObject):
             self.overlay.stash_task_widget(task.id)
             self.overlay.update_display()
 
-        save_active_tasks(self.tasks)
+        self._schedule_save()
 
     def unstash_task(self):
         """Unstash the focused task (only in show-all mode)."""
@@ -620,7 +724,7 @@ class AppController(QObject):
         print(f"Unstashing task: {task.name}")
         task.is_stashed = False
         self.overlay.update_display()
-        save_active_tasks(self.tasks)
+        self._schedule_save()
 
     def toggle_show_all(self):
         """Toggle visibility of stashed tasks."""
@@ -641,15 +745,21 @@ class AppController(QObject):
         # Pause all ongoing tasks and remember which ones we paused
         self._auto_paused_tasks = set()
         for task in self.tasks:
-            if task.state == TaskState.ONGOING:
+            if task.state is TaskState.ONGOING:
                 task.end_interval()
+                task.elapsed_seconds = task.compute_elapsed()
                 task.state = TaskState.PAUSED
                 task.last_alarm_level = 0  # Reset so alarm re-fires on resume
                 self._auto_paused_tasks.add(task.id)
 
         if self._auto_paused_tasks:
-            save_active_tasks(self.tasks)
-            self.overlay.update_display()
+            self.timer_engine.invalidate()
+            # Write now and wait for it: neither the save timer nor the
+            # writer thread may get to run before the machine sleeps
+            self._flush_save()
+            self._writer.flush()
+            if self.overlay.isVisible():
+                self.overlay.update_display()
             print(f"Auto-paused {len(self._auto_paused_tasks)} task(s)")
 
     def _on_wake(self):
@@ -659,9 +769,12 @@ class AppController(QObject):
         # Force-recreate the event tap — macOS often silently kills it across sleep
         self.hotkey_manager.force_recreate()
 
+        # Only the auto-paused tasks need visiting; mutate them all, then
+        # write and redraw once for the whole batch
         resumed = 0
-        for task in self.tasks:
-            if task.id in self._auto_paused_tasks and task.state == TaskState.PAUSED:
+        for task_id in self._auto_paused_tasks:
+            task = self._tasks_by_id.get(task_id)
+            if task is not None and task.state is TaskState.PAUSED:
                 task.state = TaskState.ONGOING
                 task.start_interval()
                 resumed += 1
@@ -669,8 +782,10 @@ class AppController(QObject):
         self._auto_paused_tasks = set()
 
         if resumed > 0:
-            save_active_tasks(self.tasks)
-            self.overlay.update_display()
+            self.timer_engine.invalidate()
+            self._flush_save()
+            if self.overlay.isVisible():
+                self.overlay.update_display()
             print(f"Resumed {resumed} auto-paused task(s)")
 
     def show_help(self):
@@ -702,6 +817,7 @@ def main():
     try:
         # Create and run controller
         controller = AppController()
+        app.aboutToQuit.connect(controller.shutdown)
 
         # Run event loop
         exit_code = app.exec()
@@ -1,9 +1,10 @@
 """Data models for etime application."""
 
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Optional, List
+import time
 import uuid
 
 
@@ -15,11 +16,11 @@ class TaskState(str, Enum):
     COMPLETED = "completed"
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """Represents a single time-tracked task."""
 
-    id: str                              # uuid4 string
+    id: str                              # uuid4 hex (older data: hyphenated)
     name: str                            # e.g., "implement baseline"
     estimated_seconds: int               # e.g., 1800 for 30 min
     state: TaskState = TaskState.ONGOING
@@ -30,59 +31,98 @@ class Task:
     ambitious_seconds: Optional[int] = None  # Stretch goal time (must be <= estimated)
     linear_issue: Optional[str] = None   # e.g., "MSH-28" (for future use)
     last_alarm_level: int = 0            # 0=none, 1=overtime, 2=2x, 3=3x...
-    work_intervals: List[dict] = field(default_factory=list)  # [{"start": ISO, "end": ISO|None}]
+    work_intervals: List[dict] = field(default_factory=list)  # [{"start": ISO, "end": ISO|None, "duration": s}]
     parent_task_id: Optional[str] = None  # ID of parent task (for subtasks)
     is_stashed: bool = False  # Hidden from default view but not completed
+    # Runtime-only caches for compute_elapsed (never serialized)
+    _closed_seconds: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    _open_start_ts: Optional[float] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Auto-generate ID and timestamp if not provided."""
         if not self.id:
-            self.id = str(uuid.uuid4())
+            self.id = uuid.uuid4().hex
         if not self.created_at:
             self.created_at = datetime.now().isoformat()
 
     def to_dict(self) -> dict:
-        """Convert Task to dictionary for JSON serialization."""
-        d = asdict(self)
-        d['state'] = self.state.value
-        return d
+        """Convert Task to dictionary for JSON serialization.
+
+        Built by hand rather than with asdict(), which deep-copies every field.
+        work_intervals is copied one level deep (its dicts hold only strings and
+        floats), so the result is a snapshot that later start/end_interval calls
+        cannot change while it waits to be written on another thread.
+        """
+        return {
+            'id': self.id,
+            'name': self.name,
+            'estimated_seconds': self.estimated_seconds,
+            'state': self.state.value,
+            'elapsed_seconds': self.elapsed_seconds,
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'completed_at': self.completed_at,
+            'ambitious_seconds': self.ambitious_seconds,
+            'linear_issue': self.linear_issue,
+            'last_alarm_level': self.last_alarm_level,
+            'work_intervals': [dict(iv) for iv in self.work_intervals],
+            'parent_task_id': self.parent_task_id,
+            'is_stashed': self.is_stashed,
+        }
 
     def start_interval(self) -> None:
         """Record the start of a new work interval (task started/resumed)."""
-        self.work_intervals.append({"start": datetime.now().isoformat(), "end": None})
+        ts = time.time()
+        self.work_intervals.append({"start": datetime.fromtimestamp(ts).isoformat(), "end": None})
+        self._open_start_ts = ts
 
     def end_interval(self) -> None:
         """Close the current open work interval (task paused/completed)."""
         if self.work_intervals and self.work_intervals[-1]["end"] is None:
-            self.work_intervals[-1]["end"] = datetime.now().isoformat()
+            iv = self.work_intervals[-1]
+            end = datetime.now()
+            iv["end"] = end.isoformat()
+            iv["duration"] = (end - datetime.fromisoformat(iv["start"])).total_seconds()
+            if self._closed_seconds is not None:
+                self._closed_seconds += iv["duration"]
+            self._open_start_ts = None
 
-    def compute_elapsed(self) -> float:
+    def compute_elapsed(self, now: Optional[float] = None) -> float:
         """Compute elapsed seconds from work intervals (single source of truth).
 
         Falls back to self.elapsed_seconds for old tasks without intervals,
-        ensuring full backwards compatibility.
+        ensuring full backwards compatibility. The closed-interval total and
+        the open interval's start are cached as floats, so the per-tick cost
+        is a subtraction rather than timestamp parsing.
+
+        Args:
+            now: Current time.time(); pass one value when computing many tasks at once.
         """
         if not self.work_intervals:
             return self.elapsed_seconds
-        total = 0.0
-        now = datetime.now()
-        for iv in self.work_intervals:
-            start = datetime.fromisoformat(iv["start"])
-            end = datetime.fromisoformat(iv["end"]) if iv["end"] else now
-            total += (end - start).total_seconds()
-        return total
+        if self._closed_seconds is None:
+            self._closed_seconds = sum(
+                iv["duration"] for iv in self.work_intervals if iv["end"]
+            )
+        last = self.work_intervals[-1]
+        if last["end"]:
+            return self._closed_seconds
+        if self._open_start_ts is None:
+            # Interval loaded from disk: parse its start once
+            self._open_start_ts = datetime.fromisoformat(last["start"]).timestamp()
+        if now is None:
+            now = time.time()
+        return self._closed_seconds + (now - self._open_start_ts)
 
     @classmethod
     def from_dict(cls, d: dict) -> 'Task':
         """Create Task from dictionary (JSON deserialization)."""
         d['state'] = TaskState(d['state'])
-        # Handle old data missing fields
-        if 'ambitious_seconds' not in d:
-            d['ambitious_seconds'] = None
-        if 'work_intervals' not in d:
-            d['work_intervals'] = []
-        if 'parent_task_id' not in d:
-            d['parent_task_id'] = None
-        if 'is_stashed' not in d:
-            d['is_stashed'] = False
+        # Fields missing from old data fall back to the dataclass defaults
+        for iv in d.get('work_intervals', ()):
+            # Intervals saved before durations were recorded
+            if iv.get('end') and 'duration' not in iv:
+                iv['duration'] = (
+                    datetime.fromisoformat(iv['end']) - datetime.fromisoformat(iv['start'])
+                ).total_seconds()
         return cls(**d)
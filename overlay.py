@@ -1,11 +1,12 @@
 """Main overlay window for etime application."""
 
+from functools import lru_cache
 from typing import List, Optional, Dict
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QGraphicsOpacityEffect, QSizePolicy
 )
-from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve
+from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve, QTimer
 from PyQt6.QtGui import QFont, QScreen
 
 from models import Task, TaskState
@@ -17,6 +18,37 @@ from config import (
     FADE_IN_DURATION_MS, FADE_OUT_DURATION_MS
 )
 
+# Green flash for a completed row. Row styling otherwise comes from the
+# overlay-wide sheet (see OverlayWindow._setup_window); this one is built once.
+_CELEBRATION_STYLE = """
+    TaskWidget {
+        background-color: #A5D6A7;
+        border-radius: 6px;
+        border: 2px solid #4CAF50;
+        padding: 2px;
+    }
+    QLabel {
+        color: #1B5E20;
+        background-color: transparent;
+        border: none;
+        font-weight: bold;
+    }
+"""
+
+# Confetti particle looks, with stylesheet strings built once
+_CONFETTI_COLORS = ["#4CAF50", "#FF9800", "#2196F3", "#E91E63", "#9C27B0", "#FFEB3B"]
+_CONFETTI_CHARS = ["●", "■", "▲", "★", "◆"]
+_CONFETTI_STYLES = [
+    f"color: {color}; font-size: 14px; background: transparent; border: none;"
+    for color in _CONFETTI_COLORS
+]
+
+
+@lru_cache(maxsize=4096)
+def _format_mmss(total_secs: int) -> str:
+    """Format whole seconds as MM:SS (memoized; values repeat every refresh)."""
+    return f"{total_secs // 60:02d}:{total_secs % 60:02d}"
+
 
 class TaskWidget(QWidget):
     """Widget displaying a single task."""
@@ -28,6 +60,9 @@ class TaskWidget(QWidget):
         self.is_alarmed = False  # Track if task has active alarm
         self.is_subtask = False  # Track indentation
         self.is_stashed = False  # Track stashed display state
+        self._applied_style = None  # Last (tone, focused, alarmed) pushed to Qt
+        self._time_key = None  # Last (elapsed, ambitious, estimated) shown
+        self._last_sig = None  # Everything update_display renders from
 
         # Create layout
         layout = QHBoxLayout()
@@ -60,70 +95,81 @@ class TaskWidget(QWidget):
         # Prevent shrinking when new tasks are added to the overlay
         self.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Minimum)
 
+        # Reusable opacity effect for fades; disabled (no offscreen render)
+        # except while a fade is running
+        self._opacity_effect = QGraphicsOpacityEffect(self)
+        self._opacity_effect.setEnabled(False)
+        self.setGraphicsEffect(self._opacity_effect)
+
         self.update_display()
 
     def update_display(self):
         """Update widget appearance based on task state."""
-        # Format times
-        elapsed_str = self._format_time(self.task.elapsed_seconds)
-        estimated_str = self._format_time(self.task.estimated_seconds)
-
-        # Format ambitious time (-- when None)
-        if self.task.ambitious_seconds is not None:
-            ambitious_str = self._format_time(self.task.ambitious_seconds)
-        else:
-            ambitious_str = "--:--"
-
-        # Always show 3-value display: actual / ambitious / estimated
-        self.time_label.setText(f"{elapsed_str} / {ambitious_str} / {estimated_str}")
+        # Nothing visible changes between whole seconds, so bail out early
+        # when none of the rendered inputs moved
+        task = self.task
+        sig = (
+            task.id, task.name, task.state, int(task.elapsed_seconds),
+            task.estimated_seconds, task.ambitious_seconds,
+            self.is_focused, self.is_alarmed, self.property("stashed") or False,
+        )
+        if sig == self._last_sig:
+            return
+        self._last_sig = sig
+
+        # Always show 3-value display: actual / ambitious / estimated.
+        # Only whole seconds are shown, so skip setText when they're unchanged
+        ambitious = self.task.ambitious_seconds
+        time_key = (
+            int(self.task.elapsed_seconds),
+            -1 if ambitious is None else int(ambitious),
+            int(self.task.estimated_seconds),
+        )
+        if time_key != self._time_key:
+            self._time_key = time_key
+            elapsed, ambitious_secs, estimated = time_key
+            # Format ambitious time (-- when None)
+            ambitious_str = "--:--" if ambitious_secs < 0 else _format_mmss(ambitious_secs)
+            self.time_label.setText(
+                f"{_format_mmss(elapsed)} / {ambitious_str} / {_format_mmss(estimated)}"
+            )
 
         # Check if task is in ambitious state (ongoing, has ambitious target, within it)
         in_ambitious = (
-            self.task.state == TaskState.ONGOING
+            self.task.state is TaskState.ONGOING
             and self.task.ambitious_seconds is not None
             and self.task.elapsed_seconds < self.task.ambitious_seconds
         )
 
-        # Determine text color
-        if self.task.state == TaskState.PAUSED:
-            color = COLOR_PAUSED
+        # Determine text tone (colors live in the overlay-wide stylesheet)
+        self.is_stashed = self.property("stashed") or False
+        if self.is_stashed:
+            # Stashed tasks get dimmed appearance with marker
+            tone = "stashed"
+        elif self.task.state is TaskState.PAUSED:
+            tone = "paused"
         elif self.task.elapsed_seconds >= self.task.estimated_seconds:
             # Overtime tasks are always red (focused or not)
-            color = COLOR_OVERTIME
+            tone = "overtime"
         elif in_ambitious:
             # Within ambitious time target - green
-            color = COLOR_AMBITIOUS
+            tone = "ambitious"
         elif self.is_focused:
             # Focused ongoing task is black
-            color = COLOR_NORMAL
+            tone = "normal"
         else:
             # Non-focused ongoing task is dimmed gray
-            color = COLOR_UNFOCUSED
-
-        # Stashed tasks get dimmed appearance with marker
-        self.is_stashed = self.property("stashed") or False
-        if self.is_stashed:
-            color = "#999999"
-            bg_color = "#F0F0F0" if self.is_focused else "#E8E8E8"
-            border_color = "#CCCCCC"
-        else:
-            bg_color = COLOR_FOCUSED if self.is_focused else "#FFFFFF"
-            border_color = "#DDDDDD"
-
-        # Apply styling
-        self.setStyleSheet(f"""
-            TaskWidget {{
-                background-color: {bg_color};
-                border-radius: 6px;
-                border: 1px solid {border_color};
-                padding: 2px;
-            }}
-            QLabel {{
-                color: {color};
-                background-color: transparent;
-                border: none;
-            }}
-        """)
+            tone = "unfocused"
+
+        # Restyle only when a selector input changed; the rules are parsed
+        # once, so this is a property flip plus repolish
+        style_key = (tone, self.is_focused, self.is_alarmed)
+        if style_key != self._applied_style:
+            self._applied_style = style_key
+            self.setProperty("tone", tone)
+            self.setProperty("focused", self.is_focused)
+            self.setProperty("alarmed", self.is_alarmed)
+            self._repolish()
 
         # Update focus indicator
         self.focus_label.setText(FOCUS_INDICATOR if self.is_focused else NO_FOCUS_INDICATOR)
@@ -132,27 +178,24 @@ class TaskWidget(QWidget):
         name_text = f"⏸ {self.task.name}" if self.is_stashed else self.task.name
         self.name_label.setText(name_text)
 
-        # Make text bold if alarmed
-        if self.is_alarmed:
-            self.name_label.setStyleSheet("font-weight: bold; background-color: transparent; border: none;")
-            time_font = self.time_label.font()
-            time_font.setBold(True)
-            self.time_label.setFont(time_font)
-        else:
-            self.name_label.setStyleSheet("font-weight: normal; background-color: transparent; border: none;")
-            time_font = self.time_label.font()
-            time_font.setBold(False)
-            self.time_label.setFont(time_font)
+    def _repolish(self):
+        """Re-apply stylesheet rules after a dynamic property change."""
+        style = self.style()
+        for w in (self, self.focus_label, self.name_label, self.time_label):
+            style.unpolish(w)
+            style.polish(w)
 
     def set_focused(self, focused: bool):
-        """Update focus state and refresh display."""
-        self.is_focused = focused
-        self.update_display()
+        """Update focus state and refresh display if it changed."""
+        if self.is_focused != focused:
+            self.is_focused = focused
+            self.update_display()
 
     def set_alarmed(self, alarmed: bool):
-        """Set alarm status and refresh display."""
-        self.is_alarmed = alarmed
-        self.update_display()
+        """Set alarm status and refresh display if it changed."""
+        if self.is_alarmed != alarmed:
+            self.is_alarmed = alarmed
+            self.update_display()
 
     def set_indent(self, indent: bool):
         """Set subtask indentation and refresh display."""
@@ -163,14 +206,6 @@ class TaskWidget(QWidget):
             layout.setContentsMargins(left, 4, 8, 4)
             self.update_display()
 
-    @staticmethod
-    def _format_time(seconds: float) -> str:
-        """Format seconds as MM:SS."""
-        total_secs = int(seconds)
-        mins = total_secs // 60
-        secs = total_secs % 60
-        return f"{mins:02d}:{secs:02d}"
-
 
 class OverlayWindow(QWidget):
     """Main overlay window displaying all active tasks."""
@@ -182,6 +217,7 @@ class OverlayWindow(QWidget):
         self.task_widgets: Dict[str, TaskWidget] = {}  # task_id -> TaskWidget
         self.show_all: bool = False  # When True, stashed tasks are visible
         self.focused_index = 0 if tasks else -1
+        self._resize_pending = False  # adjustSize queued (see _schedule_adjust_size)
 
         self._setup_window()
         self._setup_ui()
@@ -196,13 +232,39 @@ class OverlayWindow(QWidget):
             Qt.WindowType.Tool
         )
 
-        # Window styling
+        # Window styling, plus all task row rules keyed on the dynamic
+        # properties TaskWidget sets (tone, focused, stashed, alarmed)
         self.setStyleSheet(f"""
             OverlayWindow {{
                 background-color: #FFE0B2;  /* Light orange */
                 border: 2px solid #FF9800;  /* Darker orange border */
                 border-radius: 8px;
             }}
+            TaskWidget {{
+                background-color: #FFFFFF;
+                border-radius: 6px;
+                border: 1px solid #DDDDDD;
+                padding: 2px;
+            }}
+            TaskWidget[focused="true"] {{ background-color: {COLOR_FOCUSED}; }}
+            TaskWidget[stashed="true"] {{
+                background-color: #E8E8E8;
+                border: 1px solid #CCCCCC;
+            }}
+            TaskWidget[stashed="true"][focused="true"] {{ background-color: #F0F0F0; }}
+            TaskWidget QLabel {{
+                color: {COLOR_UNFOCUSED};
+                background-color: transparent;
+                border: none;
+                font-weight: normal;
+            }}
+            TaskWidget[tone="normal"] QLabel {{ color: {COLOR_NORMAL}; }}
+            TaskWidget[tone="paused"] QLabel {{ color: {COLOR_PAUSED}; }}
+            TaskWidget[tone="overtime"] QLabel {{ color: {COLOR_OVERTIME}; }}
+            TaskWidget[tone="ambitious"] QLabel {{ color: {COLOR_AMBITIOUS}; }}
+            TaskWidget[tone="stashed"] QLabel {{ color: #999999; }}
+            /* Bold text if alarmed */
+            TaskWidget[alarmed="true"] QLabel {{ font-weight: bold; }}
         """)
 
         # macOS-specific: ensure window stays visible
@@ -213,6 +275,8 @@ class OverlayWindow(QWidget):
 
     def position_at_top_right(self):
         """Position window at top-right corner of screen."""
+        # Positioning depends on width, so apply any queued resize first
+        self._apply_pending_resize()
         screen = QScreen.availableGeometry(self.screen())
         # Calculate position: screen_width - window_width - margin
         x = screen.width() - self.width() - WINDOW_MARGIN_X
@@ -244,12 +308,20 @@ class OverlayWindow(QWidget):
             self.focused_index = 0
         else:
             self.focused_index = -1
-        for i, task in enumerate(visible):
-            widget = TaskWidget(task, i == self.focused_index)
-            if task.is_stashed:
-                widget.setProperty("stashed", True)
-            self.task_widgets[task.id] = widget
-            self.layout.addWidget(widget)
+        self.setUpdatesEnabled(False)
+        try:
+            for i, task in enumerate(visible):
+                widget = TaskWidget(task, i == self.focused_index)
+                if task.is_stashed:
+                    widget.setProperty("stashed", True)
+                self.task_widgets[task.id] = widget
+                self.layout.addWidget(widget)
+        finally:
+            self.setUpdatesEnabled(True)
+
+        # Size to the full list once, then anchor to the final width
+        self.adjustSize()
+        self.position_at_top_right()
 
     def _add_task_widget(self, task: Task, is_focused: bool, animate: bool = True):
         """Add a task widget to the layout."""
@@ -270,7 +342,7 @@ class OverlayWindow(QWidget):
         self._add_task_widget(task, is_focused, animate=True)
 
         # Adjust window size
-        self.adjustSize()
+        self._schedule_adjust_size()
 
     def insert_task(self, task: Task, index: int):
         """Insert a task at a specific position with fade-in animation.
@@ -296,7 +368,7 @@ class OverlayWindow(QWidget):
         self.layout.insertWidget(layout_index + 1, widget)
 
         self._fade_in_widget(widget)
-        self.adjustSize()
+        self._schedule_adjust_size()
 
     def _remove_task_animated(self, task_id: str, green_flash: bool = False,
                               confetti: bool = False, confetti_count: int = 12, callback=None):
@@ -318,35 +390,20 @@ class OverlayWindow(QWidget):
                 self.layout.removeWidget(widget)
                 widget.deleteLater()
                 del self.task_widgets[task_id]
-                self.adjustSize()
+                self._schedule_adjust_size()
                 if callback:
                     callback()
             self._fade_out_widget(widget, on_fade_finished)
 
         if green_flash:
-            widget.setStyleSheet("""
-                TaskWidget {
-                    background-color: #A5D6A7;
-                    border-radius: 6px;
-                    border: 2px solid #4CAF50;
-                    padding: 2px;
-                }
-                QLabel {
-                    color: #1B5E20;
-                    background-color: transparent;
-                    border: none;
-                    font-weight: bold;
-                }
-            """)
+            widget.setStyleSheet(_CELEBRATION_STYLE)
             if confetti:
                 self._spawn_confetti(widget, count=confetti_count)
-            from PyQt6.QtCore import QTimer
             delay = 600 if confetti else 400
             QTimer.singleShot(delay, finish_removal)
         elif confetti:
             # Mini confetti without green flash (normal completion)
             self._spawn_confetti(widget, count=confetti_count)
-            from PyQt6.QtCore import QTimer
             QTimer.singleShot(100, finish_removal)
         else:
             finish_removal()
@@ -365,58 +422,61 @@ class OverlayWindow(QWidget):
                                    callback=callback)
 
     def _spawn_confetti(self, source_widget, count: int = 12):
-        """Spawn confetti particle labels that scatter from the widget."""
+        """Spawn confetti particle labels that scatter from the widget.
+
+        One ~60 Hz timer steps every particle, instead of a position and an
+        opacity animation (each with its own timer) per particle. All particles
+        share one fade, so they live in a single layer with one opacity effect
+        (one offscreen composition per frame rather than one per particle).
+        """
         import random
-        from PyQt6.QtCore import QTimer
+        import time
 
-        confetti_colors = ["#4CAF50", "#FF9800", "#2196F3", "#E91E63", "#9C27B0", "#FFEB3B"]
-        confetti_chars = ["●", "■", "▲", "★", "◆"]
+        duration_s = 0.5
 
         center_x = source_widget.x() + source_widget.width() // 2
         center_y = source_widget.y() + source_widget.height() // 2
 
+        # Transparent layer over the whole overlay holding every particle
+        layer = QWidget(self)
+        layer.setGeometry(self.rect())
+        layer.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        opacity = QGraphicsOpacityEffect(layer)
+        layer.setGraphicsEffect(opacity)
+
         particles = []
         for _ in range(count):
-            color = random.choice(confetti_colors)
-            char = random.choice(confetti_chars)
-
-            particle = QLabel(char, self)
-            particle.setStyleSheet(f"color: {color}; font-size: 14px; background: transparent; border: none;")
+            particle = QLabel(random.choice(_CONFETTI_CHARS), layer)
+            particle.setStyleSheet(random.choice(_CONFETTI_STYLES))
             particle.setFixedSize(20, 20)
             particle.move(center_x, center_y)
-            particle.show()
 
-            # Animate particle outward
+            # Scatter offset for this particle
             dx = random.randint(-80, 80)
             dy = random.randint(-60, 60)
-
-            anim = QPropertyAnimation(particle, b"pos")
-            anim.setDuration(500)
-            anim.setStartValue(particle.pos())
-            from PyQt6.QtCore import QPoint
-            anim.setEndValue(QPoint(center_x + dx, center_y + dy))
-            anim.setEasingCurve(QEasingCurve.Type.OutQuad)
-
-            # Fade out particle
-            opacity = QGraphicsOpacityEffect(particle)
-            particle.setGraphicsEffect(opacity)
-            fade = QPropertyAnimation(opacity, b"opacity")
-            fade.setDuration(500)
-            fade.setStartValue(1.0)
-            fade.setEndValue(0.0)
-            fade.setEasingCurve(QEasingCurve.Type.InQuad)
-
-            anim.start()
-            fade.start()
-
-            particles.append((particle, anim, fade))
-
-        # Clean up particles after animation
-        def cleanup():
-            for p, a, f in particles:
-                p.deleteLater()
-
-        QTimer.singleShot(600, cleanup)
+            particles.append((particle, dx, dy))
+
+        layer.show()
+        layer.raise_()
+
+        timer = QTimer(self)
+        timer.setInterval(16)
+        start = time.monotonic()
+
+        def step():
+            t = min((time.monotonic() - start) / duration_s, 1.0)
+            travel = 1 - (1 - t) ** 2  # OutQuad: move outward
+            opacity.setOpacity(1 - t * t)  # InQuad: fade out
+            for particle, dx, dy in particles:
+                particle.move(center_x + int(dx * travel), center_y + int(dy * travel))
+            if t >= 1.0:
+                # Clean up particles (children of the layer) after animation
+                timer.stop()
+                timer.deleteLater()
+                layer.deleteLater()
+
+        timer.timeout.connect(step)
+        timer.start()
 
     def _visible_tasks(self) -> List[Task]:
         """Return tasks that should be visible based on show_all mode."""
@@ -434,7 +494,7 @@ class OverlayWindow(QWidget):
             self.layout.removeWidget(widget)
             widget.deleteLater()
             del self.task_widgets[task_id]
-            self.adjustSize()
+            self._schedule_adjust_size()
 
         self._fade_out_widget(widget, callback=on_fade_finished)
 
@@ -454,14 +514,18 @@ class OverlayWindow(QWidget):
 
         # Re-add widgets for visible tasks
         visible = self._visible_tasks()
-        for i, task in enumerate(visible):
-            is_focused = (i == self.focused_index)
-            widget = TaskWidget(task, is_focused)
-            if task.is_stashed:
-                widget.setProperty("stashed", True)
-            self.task_widgets[task.id] = widget
-            self.layout.addWidget(widget)
-            self._fade_in_widget(widget)
+        self.setUpdatesEnabled(False)
+        try:
+            for i, task in enumerate(visible):
+                is_focused = (i == self.focused_index)
+                widget = TaskWidget(task, is_focused)
+                if task.is_stashed:
+                    widget.setProperty("stashed", True)
+                self.task_widgets[task.id] = widget
+                self.layout.addWidget(widget)
+                self._fade_in_widget(widget)
+        finally:
+            self.setUpdatesEnabled(True)
 
         # Clamp focus
         if visible:
@@ -469,22 +533,39 @@ class OverlayWindow(QWidget):
         else:
             self.focused_index = -1
 
-        self.adjustSize()
+        self._schedule_adjust_size()
         self.update_display()
 
     def update_display(self):
         """Update all task widgets."""
-        active_task_ids = {t.id for t in self.tasks}
+        # Subtask indentation needs the active ids: reuse the controller's
+        # id index (it mirrors self.tasks) instead of building a set per refresh
+        if self.app_controller:
+            active_task_ids = self.app_controller.tasks_by_id
+            # Look the alarm set up once rather than calling back per task
+            active_alarms = self.app_controller.active_alarms
+        else:
+            active_task_ids = {t.id for t in self.tasks}
+            active_alarms = None
         visible = self._visible_tasks()
+        # Let Qt coalesce every row's changes into a single repaint
+        self.setUpdatesEnabled(False)
+        try:
+            self._update_rows(visible, active_task_ids, active_alarms)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _update_rows(self, visible: List[Task], active_task_ids, active_alarms):
+        """Push focus/alarm/indent/stash state into each visible task widget."""
         for i, task in enumerate(visible):
             if task.id in self.task_widgets:
                 widget = self.task_widgets[task.id]
                 widget.task = task
-                widget.set_focused(i == self.focused_index)
+                # Set state directly; the widget refreshes once at the end
+                widget.is_focused = i == self.focused_index
                 # Pass alarm status if app_controller is available
-                if self.app_controller:
-                    is_alarmed = self.app_controller.is_task_alarmed(task.id)
-                    widget.set_alarmed(is_alarmed)
+                if active_alarms is not None:
+                    widget.is_alarmed = task.id in active_alarms
                 # Indent if this is an active subtask (parent still in active list)
                 is_subtask = bool(
                     task.parent_task_id and task.parent_task_id in active_task_ids
@@ -494,6 +575,27 @@ class OverlayWindow(QWidget):
                 widget.setProperty("stashed", task.is_stashed)
                 widget.update_display()
 
+    def _schedule_adjust_size(self):
+        """Resize to fit contents once control returns to the event loop.
+
+        Several adds/removes in a row then cost a single layout pass.
+        """
+        if not self._resize_pending:
+            self._resize_pending = True
+            QTimer.singleShot(0, self._apply_pending_resize)
+
+    def _apply_pending_resize(self):
+        """Run a queued adjustSize now, if one is pending."""
+        if self._resize_pending:
+            self._resize_pending = False
+            self.adjustSize()
+
+    def update_task_display(self, task_id: str):
+        """Refresh a single task widget (e.g. its elapsed time changed)."""
+        widget = self.task_widgets.get(task_id)
+        if widget is not None:
+            widget.update_display()
+
     def move_focus(self, direction: int):
         """
         Move focus up (-1) or down (+1).
@@ -508,17 +610,18 @@ class OverlayWindow(QWidget):
         # Update focused index with wrap-around
         old_index = self.focused_index
         self.focused_index = (self.focused_index + direction) % len(visible)
+        if self.focused_index == old_index:
+            return  # Single task: nothing to restyle
 
-        # Update widget displays
+        # Update only the two affected widgets (a property flip + repolish each)
         if 0 <= old_index < len(visible):
-            task_id = visible[old_index].id
-            if task_id in self.task_widgets:
-                self.task_widgets[task_id].set_focused(False)
+            widget = self.task_widgets.get(visible[old_index].id)
+            if widget is not None:
+                widget.set_focused(False)
 
-        if 0 <= self.focused_index < len(visible):
-            task_id = visible[self.focused_index].id
-            if task_id in self.task_widgets:
-                self.task_widgets[task_id].set_focused(True)
+        widget = self.task_widgets.get(visible[self.focused_index].id)
+        if widget is not None:
+            widget.set_focused(True)
 
     def get_focused_task(self) -> Optional[Task]:
         """Get currently focused task."""
@@ -532,25 +635,27 @@ class OverlayWindow(QWidget):
         print("WARNING: Overlay window close event triggered!")
         event.ignore()  # Don't allow closing the main overlay
 
-    def _fade_in_widget(self, widget: QWidget):
+    def _fade_in_widget(self, widget: TaskWidget):
         """Fade in a widget."""
-        effect = QGraphicsOpacityEffect(widget)
-        widget.setGraphicsEffect(effect)
+        effect = widget._opacity_effect
+        effect.setEnabled(True)
 
         animation = QPropertyAnimation(effect, b"opacity")
         animation.setDuration(FADE_IN_DURATION_MS)
         animation.setStartValue(0.0)
         animation.setEndValue(1.0)
         animation.setEasingCurve(QEasingCurve.Type.InOutQuad)
+        # Fully opaque again: stop paying for the effect
+        animation.finished.connect(lambda: effect.setEnabled(False))
         animation.start()
 
         # Keep reference to prevent garbage collection
         widget._fade_animation = animation
 
-    def _fade_out_widget(self, widget: QWidget, callback=None):
+    def _fade_out_widget(self, widget: TaskWidget, callback=None):
         """Fade out a widget."""
-        effect = QGraphicsOpacityEffect(widget)
-        widget.setGraphicsEffect(effect)
+        effect = widget._opacity_effect
+        effect.setEnabled(True)
 
         animation = QPropertyAnimation(effect, b"opacity")
         animation.setDuration(FADE_OUT_DURATION_MS)
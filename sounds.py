@@ -9,6 +9,62 @@ from config import ALARM_FILE, SUCCESS_SOUND_FILE, AMBITIOUS_SOUND_FILE
 _current_sound = None  # Keep reference to prevent garbage collection
 _sound_loop_active = False
 
+# key -> (NSSound or None, description); filled by reload_sounds()
+_SOUND_CACHE = {}
+
+
+def _load_or_fallback(custom_file, fallback_names, label):
+    """
+    Load a custom sound file if it exists, else the first available system sound.
+
+    Returns:
+        (NSSound, description) tuple, or (None, None) if nothing could be loaded.
+    """
+    custom_path = os.path.expanduser(str(custom_file))
+    if os.path.exists(custom_path):
+        try:
+            sound = NSSound.alloc().initWithContentsOfFile_byReference_(
+                custom_path, True
+            )
+            if sound:
+                return sound, f"custom {label}"
+        except Exception as e:
+            print(f"Warning: Failed to load custom {label} {custom_path}: {e}")
+
+    for sound_name in fallback_names:
+        try:
+            sound = NSSound.soundNamed_(sound_name)
+            if sound:
+                return sound, f"system {label} '{sound_name}'"
+        except Exception as e:
+            print(f"Warning: Failed to load '{sound_name}': {e}")
+
+    return None, None
+
+
+def reload_sounds() -> None:
+    """
+    (Re)load all sounds. Call after changing the custom files in ~/.etime.
+
+    Custom files (alarm.aiff, success.aiff, ambitious.aiff) take precedence;
+    otherwise the alarm uses "Ping", success "Purr", and ambitious success
+    "Glass" (more celebratory), each falling back further to system sounds.
+    """
+    _SOUND_CACHE["alarm"] = _load_or_fallback(ALARM_FILE, ("Ping",), "alarm")
+    _SOUND_CACHE["success"] = _load_or_fallback(
+        SUCCESS_SOUND_FILE, ("Purr", "Hero"), "success sound"
+    )
+    _SOUND_CACHE["ambitious"] = _load_or_fallback(
+        AMBITIOUS_SOUND_FILE, ("Glass", "Purr", "Hero"), "ambitious success sound"
+    )
+
+
+def _cached_sound(key):
+    """Return the cached (sound, description) for key, loading all on first use."""
+    if not _SOUND_CACHE:
+        reload_sounds()
+    return _SOUND_CACHE[key]
+
 
 def play_alarm_loop() -> None:
     """
@@ -26,32 +82,18 @@ def play_alarm_loop() -> None:
 
     _sound_loop_active = True
 
-    # Try custom alarm file first
-    custom_path = os.path.expanduser(str(ALARM_FILE))
-    if os.path.exists(custom_path):
-        try:
-            _current_sound = NSSound.alloc().initWithContentsOfFile_byReference_(
-                custom_path, True
-            )
-            if _current_sound:
-                _current_sound.setLoops_(True)  # Enable looping
-                _current_sound.play()
-                print("Playing custom alarm in loop")
-                return
-        except Exception as e:
-            print(f"Warning: Failed to play custom alarm {custom_path}: {e}")
+    sound, description = _cached_sound("alarm")
+    if sound is None:
+        print("Warning: Could not load any alarm sound")
+        return
 
-    # Fall back to system sound
     try:
-        _current_sound = NSSound.soundNamed_("Ping")
-        if _current_sound:
-            _current_sound.setLoops_(True)  # Enable looping
-            _current_sound.play()
-            print("Playing system alarm in loop")
-        else:
-            print("Warning: Could not load system sound 'Ping'")
+        _current_sound = sound
+        _current_sound.setLoops_(True)  # Enable looping
+        _current_sound.play()
+        print(f"Playing {description} in loop")
     except Exception as e:
-        print(f"Warning: Failed to play system sound: {e}")
+        print(f"Warning: Failed to play {description}: {e}")
 
 
 def stop_alarm() -> None:
@@ -68,39 +110,30 @@ def stop_alarm() -> None:
             print(f"Warning: Failed to stop alarm: {e}")
 
 
+def _play_once(key: str) -> None:
+    """Play a cached one-shot sound, restarting it if it is still playing."""
+    sound, description = _cached_sound(key)
+    if sound is None:
+        print(f"Warning: Could not play any {key} sound")
+        return
+
+    try:
+        if sound.isPlaying():
+            sound.stop()
+        sound.play()
+        print(f"Playing {description}")
+    except Exception as e:
+        print(f"Warning: Failed to play {description}: {e}")
+
+
 def play_success_sound() -> None:
     """
     Play a short success sound when task is completed.
 
     Tries custom sound (~/.etime/success.aiff) first,
-    falls back to system "Hero" sound.
+    falls back to system "Purr" (then "Hero") sound.
     """
-    # Try custom success sound
-    custom_path = os.path.expanduser(str(SUCCESS_SOUND_FILE))
-    if os.path.exists(custom_path):
-        try:
-            sound = NSSound.alloc().initWithContentsOfFile_byReference_(
-                custom_path, True
-            )
-            if sound:
-                sound.play()
-                print("Playing custom success sound")
-                return
-        except Exception as e:
-            print(f"Warning: Failed to play custom success sound: {e}")
-
-    # Fall back to system sound - use Purr for regular completion
-    for sound_name in ("Purr", "Hero"):
-        try:
-            sound = NSSound.soundNamed_(sound_name)
-            if sound:
-                sound.play()
-                print(f"Playing system success sound '{sound_name}'")
-                return
-        except Exception as e:
-            print(f"Warning: Failed to play '{sound_name}': {e}")
-
-    print("Warning: Could not play any success sound")
+    _play_once("success")
 
 
 def play_ambitious_success_sound() -> None:
@@ -108,31 +141,6 @@ def play_ambitious_success_sound() -> None:
     Play a triumphant sound when completing a task within ambitious time.
 
     Tries custom sound (~/.etime/ambitious.aiff) first,
-    falls back to system "Purr" sound (more celebratory than "Hero").
+    falls back to system "Glass" sound (more celebratory than "Purr").
     """
-    # Try custom ambitious sound
-    custom_path = os.path.expanduser(str(AMBITIOUS_SOUND_FILE))
-    if os.path.exists(custom_path):
-        try:
-            sound = NSSound.alloc().initWithContentsOfFile_byReference_(
-                custom_path, True
-            )
-            if sound:
-                sound.play()
-                print("Playing custom ambitious success sound")
-                return
-        except Exception as e:
-            print(f"Warning: Failed to play custom ambitious sound: {e}")
-
-    # Fall back to system sound - use Glass (more celebratory) for ambitious
-    for sound_name in ("Glass", "Purr", "Hero"):
-        try:
-            sound = NSSound.soundNamed_(sound_name)
-            if sound:
-                sound.play()
-                print(f"Playing system ambitious sound '{sound_name}'")
-                return
-        except Exception as e:
-            print(f"Warning: Failed to play '{sound_name}': {e}")
-
-    print("Warning: Could not play any ambitious success sound")
+    _play_once("ambitious")
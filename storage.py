@@ -1,14 +1,32 @@
 """File storage layer for etime application."""
 
-import json
-import tempfile
+import atexit
+import hashlib
+import queue
+import threading
 import os
 from pathlib import Path
 from typing import List
 
+import orjson
+
 from models import Task
 from config import ETIME_DIR, ACTIVE_FILE, HISTORY_FILE
 
+# Digest of the last payload written to active.json (skip identical rewrites)
+_last_active_digest = None
+
+# Fixed temp sibling for atomic active.json writes; the lock keeps two
+# writers (e.g. StorageWriter and a direct save) from sharing it at once
+_ACTIVE_TEMP_FILE = ETIME_DIR / '.active.json.tmp'
+_active_write_lock = threading.Lock()
+
+# Cached O_APPEND descriptor for history.jsonl (see _get_history_fd)
+_history_fd = None
+
+# Block size for reading history.jsonl backwards on undo
+_TAIL_CHUNK_SIZE = 4096
+
 
 def ensure_etime_dir() -> None:
     """Create ~/.etime directory if it doesn't exist."""
@@ -22,31 +40,36 @@ def load_active_tasks() -> List[Task]:
     Returns:
         List of Task objects. Empty list if file doesn't exist or is corrupt.
     """
-    if not ACTIVE_FILE.exists():
-        return []
-
     try:
-        with open(ACTIVE_FILE, 'r') as f:
-            data = json.load(f)
+        data = orjson.loads(ACTIVE_FILE.read_bytes())
+    except FileNotFoundError:
+        return []
+    except Exception as e:
+        print(f"Warning: Failed to load {ACTIVE_FILE}: {e}")
+        return []
 
-        if not isinstance(data, list):
-            print(f"Warning: {ACTIVE_FILE} is not a list, starting fresh")
-            return []
+    if not isinstance(data, list):
+        print(f"Warning: {ACTIVE_FILE} is not a list, starting fresh")
+        return []
 
-        tasks = []
-        for task_dict in data:
-            try:
-                task = Task.from_dict(task_dict)
-                tasks.append(task)
-            except Exception as e:
-                print(f"Warning: Failed to load task {task_dict.get('id', 'unknown')}: {e}")
-                continue
+    # Fast path: every entry is valid
+    try:
+        return [Task.from_dict(task_dict) for task_dict in data]
+    except Exception:
+        pass
 
-        return tasks
+    # Slow path: skip the entries that fail
+    tasks = []
+    for task_dict in data:
+        try:
+            task = Task.from_dict(task_dict)
+            tasks.append(task)
+        except Exception as e:
+            task_id = task_dict.get('id', 'unknown') if isinstance(task_dict, dict) else 'unknown'
+            print(f"Warning: Failed to load task {task_id}: {e}")
+            continue
 
-    except Exception as e:
-        print(f"Warning: Failed to load {ACTIVE_FILE}: {e}")
-        return []
+    return tasks
 
 
 def save_active_tasks(tasks: List[Task]) -> None:
@@ -56,34 +79,42 @@ def save_active_tasks(tasks: List[Task]) -> None:
     Args:
         tasks: List of Task objects to save.
     """
-    ensure_etime_dir()
+    _write_active_data([task.to_dict() for task in tasks])
 
-    # Convert tasks to dictionaries
-    data = [task.to_dict() for task in tasks]
 
-    # Atomic write: write to temp file, then rename
-    try:
-        # Create temp file in same directory as target
-        fd, temp_path = tempfile.mkstemp(
-            dir=ETIME_DIR,
-            prefix='.active_',
-            suffix='.json.tmp'
-        )
+def _write_active_data(data: List[dict]) -> None:
+    """Atomically write already-serialized task dicts to active.json."""
+    global _last_active_digest
 
-        with os.fdopen(fd, 'w') as f:
-            json.dump(data, f, indent=2)
+    payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    digest = hashlib.blake2b(payload, digest_size=16).digest()
+    if digest == _last_active_digest:
+        return
 
-        # Atomic rename
-        os.rename(temp_path, ACTIVE_FILE)
+    ensure_etime_dir()
 
-    except Exception as e:
-        print(f"Error: Failed to save {ACTIVE_FILE}: {e}")
-        # Clean up temp file if it exists
+    # Atomic write: write to temp file, then rename. ~/.etime is private to
+    # the user, so a fixed sibling name replaces mkstemp's unique-name search
+    with _active_write_lock:
         try:
-            if 'temp_path' in locals():
-                os.unlink(temp_path)
-        except:
-            pass
+            fd = os.open(_ACTIVE_TEMP_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            try:
+                os.write(fd, payload)
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+            # Atomic rename
+            os.replace(_ACTIVE_TEMP_FILE, ACTIVE_FILE)
+            _last_active_digest = digest
+
+        except Exception as e:
+            print(f"Error: Failed to save {ACTIVE_FILE}: {e}")
+            # Clean up temp file if it exists
+            try:
+                os.unlink(_ACTIVE_TEMP_FILE)
+            except OSError:
+                pass
 
 
 def append_to_history(task: Task) -> None:
@@ -93,17 +124,76 @@ def append_to_history(task: Task) -> None:
     Args:
         task: Task object to append to history.
     """
-    ensure_etime_dir()
+    _append_history_data(task.to_dict())
+
+
+def _get_history_fd() -> int:
+    """Return a cached O_APPEND fd for history.jsonl, reopening if the file was removed."""
+    global _history_fd
+    if _history_fd is not None and os.fstat(_history_fd).st_nlink == 0:
+        # Deleted or replaced underneath us; don't write into the orphan
+        os.close(_history_fd)
+        _history_fd = None
+    if _history_fd is None:
+        ensure_etime_dir()
+        _history_fd = os.open(HISTORY_FILE, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    return _history_fd
+
+
+def _close_history_fd() -> None:
+    """Close the cached history.jsonl descriptor (registered with atexit)."""
+    global _history_fd
+    if _history_fd is not None:
+        os.close(_history_fd)
+        _history_fd = None
 
+
+atexit.register(_close_history_fd)
+
+
+def _append_history_data(data: dict) -> None:
+    """Append an already-serialized task dict to history.jsonl."""
     try:
-        with open(HISTORY_FILE, 'a') as f:
-            json_line = json.dumps(task.to_dict())
-            f.write(json_line + '\n')
+        # O_APPEND makes the single write land atomically at the end
+        os.write(_get_history_fd(), orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE))
 
     except Exception as e:
         print(f"Error: Failed to append to {HISTORY_FILE}: {e}")
 
 
+class StorageWriter:
+    """Performs active.json and history.jsonl writes on a background thread.
+
+    Tasks are serialized on the caller's thread (so the UI can keep mutating
+    them); the file writes happen in submission order on a daemon thread.
+    """
+
+    def __init__(self):
+        self._queue: queue.Queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="etime-writer", daemon=True)
+        self._thread.start()
+
+    def save_active(self, tasks: List[Task]) -> None:
+        """Snapshot tasks and queue an active.json rewrite."""
+        self._queue.put((_write_active_data, [task.to_dict() for task in tasks]))
+
+    def append_history(self, task: Task) -> None:
+        """Snapshot a completed task and queue a history.jsonl append."""
+        self._queue.put((_append_history_data, task.to_dict()))
+
+    def flush(self) -> None:
+        """Block until all queued writes have completed."""
+        self._queue.join()
+
+    def _run(self) -> None:
+        while True:
+            write, data = self._queue.get()
+            try:
+                write(data)
+            finally:
+                self._queue.task_done()
+
+
 def remove_last_from_history(expected_task_id: str) -> bool:
     """
     Remove the last entry from history.jsonl if it matches expected task ID.
@@ -119,36 +209,40 @@ def remove_last_from_history(expected_task_id: str) -> bool:
         return False
 
     try:
-        with open(HISTORY_FILE, 'r') as f:
-            lines = f.readlines()
-
-        if not lines:
-            print("Warning: history file is empty")
-            return False
-
-        # Parse last line and validate
-        last_line = lines[-1].strip()
-        if not last_line:
-            # Empty last line, try second to last
-            if len(lines) >= 2:
-                last_line = lines[-2].strip()
-                lines = lines[:-1]  # Remove empty line
-            else:
+        with open(HISTORY_FILE, 'r+b') as f:
+            size = f.seek(0, os.SEEK_END)
+            if size == 0:
+                print("Warning: history file is empty")
+                return False
+
+            # Read backwards until the last non-empty line is complete
+            pos = size
+            tail = b""
+            while pos > 0 and b"\n" not in tail.rstrip():
+                step = min(_TAIL_CHUNK_SIZE, pos)
+                pos -= step
+                f.seek(pos)
+                tail = f.read(step) + tail
+
+            body = tail.rstrip()
+            if not body:
                 print("Warning: no valid entries in history")
                 return False
+            nl = body.rfind(b"\n")
+            last_line = body[nl + 1:]
 
-        try:
-            last_task = json.loads(last_line)
-            if last_task.get('id') != expected_task_id:
-                print(f"Warning: last history entry ({last_task.get('id')}) doesn't match expected ({expected_task_id})")
+            # Parse last line and validate
+            try:
+                last_task = orjson.loads(last_line)
+                if last_task.get('id') != expected_task_id:
+                    print(f"Warning: last history entry ({last_task.get('id')}) doesn't match expected ({expected_task_id})")
+                    return False
+            except orjson.JSONDecodeError:
+                print("Warning: last history line is not valid JSON")
                 return False
-        except json.JSONDecodeError:
-            print("Warning: last history line is not valid JSON")
-            return False
 
-        # Rewrite file without last line
-        with open(HISTORY_FILE, 'w') as f:
-            f.writelines(lines[:-1])
+            # Drop the last line (and any blank lines after it) in place
+            f.truncate(pos + nl + 1)
 
         print(f"Removed task {expected_task_id} from history")
         return True
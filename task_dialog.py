@@ -4,8 +4,8 @@ from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel,
     QLineEdit, QSpinBox, QWidget
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont, QKeyEvent
+from PyQt6.QtCore import Qt, QLocale, QPoint, pyqtSignal
+from PyQt6.QtGui import QFont, QIntValidator, QKeySequence, QShortcut
 
 from config import (
     DEFAULT_TASK_MINUTES, MIN_TASK_MINUTES, MAX_TASK_MINUTES,
@@ -21,8 +21,37 @@ class TaskDialog(QDialog):
     # parent_task_id = "" means no parent (top-level task)
     task_submitted = pyqtSignal(str, int, int, str)
 
+    # Stylesheet shared by all instances; set once per dialog in _setup_window
+    _STYLESHEET = """
+        QDialog {
+            background-color: white;
+            border: 2px solid #2196F3;
+            border-radius: 8px;
+        }
+        QLabel {
+            color: #333333;
+        }
+        QLabel#fieldLabel {
+            min-width: 80px;
+            max-width: 80px;
+        }
+        QLineEdit, QSpinBox {
+            border: 1px solid #CCCCCC;
+            border-radius: 4px;
+            padding: 6px;
+            font-size: 14px;
+        }
+        QLineEdit:focus, QSpinBox:focus {
+            border: 2px solid #2196F3;
+        }
+    """
+
+    _title_font: QFont | None = None  # Shared by all instances (see _get_title_font)
+
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._center_key = None  # (screen, size) the cached _center_pos was computed for
+        self._center_pos = QPoint()
         self._setup_window()
         self._setup_ui()
 
@@ -35,29 +64,20 @@ class TaskDialog(QDialog):
             Qt.WindowType.Dialog
         )
 
-        # Styling
-        self.setStyleSheet("""
-            QDialog {
-                background-color: white;
-                border: 2px solid #2196F3;
-                border-radius: 8px;
-            }
-            QLabel {
-                color: #333333;
-            }
-            QLineEdit, QSpinBox {
-                border: 1px solid #CCCCCC;
-                border-radius: 4px;
-                padding: 6px;
-                font-size: 14px;
-            }
-            QLineEdit:focus, QSpinBox:focus {
-                border: 2px solid #2196F3;
-            }
-        """)
+        self.setStyleSheet(self._STYLESHEET)
 
         self.setFixedWidth(350)
 
+    @classmethod
+    def _get_title_font(cls) -> QFont:
+        """Return the title font, built once and shared across dialogs."""
+        if cls._title_font is None:
+            font = QFont()
+            font.setPointSize(16)
+            font.setBold(True)
+            cls._title_font = font
+        return cls._title_font
+
     def _setup_ui(self):
         """Setup UI elements."""
         layout = QVBoxLayout()
@@ -66,17 +86,14 @@ class TaskDialog(QDialog):
 
         # Title
         title = QLabel("New Task")
-        title_font = QFont()
-        title_font.setPointSize(16)
-        title_font.setBold(True)
-        title.setFont(title_font)
+        title.setFont(self._get_title_font())
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title)
 
         # Name field
         name_layout = QHBoxLayout()
         name_label = QLabel("Name:")
-        name_label.setFixedWidth(80)
+        name_label.setObjectName("fieldLabel")
         self.name_input = QLineEdit()
         self.name_input.setPlaceholderText("e.g., paper-exp")
         name_layout.addWidget(name_label)
@@ -86,7 +103,7 @@ class TaskDialog(QDialog):
         # Time field
         time_layout = QHBoxLayout()
         time_label = QLabel("Time:")
-        time_label.setFixedWidth(80)
+        time_label.setObjectName("fieldLabel")
         self.time_input = QSpinBox()
         self.time_input.setMinimum(MIN_TASK_MINUTES)
         self.time_input.setMaximum(MAX_TASK_MINUTES)
@@ -99,9 +116,16 @@ class TaskDialog(QDialog):
         # Ambitious time field (QLineEdit so user can leave empty = no target)
         ambitious_layout = QHBoxLayout()
         ambitious_label = QLabel("Ambitious:")
-        ambitious_label.setFixedWidth(80)
+        ambitious_label.setObjectName("fieldLabel")
         self.ambitious_input = QLineEdit()
         self.ambitious_input.setPlaceholderText("optional mins")
+        # Digits only, so _submit can parse without a try/except ("C" locale
+        # without group separators keeps "1,000" out of the text)
+        validator = QIntValidator(0, MAX_TASK_MINUTES, self)
+        number_locale = QLocale.c()
+        number_locale.setNumberOptions(QLocale.NumberOption.RejectGroupSeparator)
+        validator.setLocale(number_locale)
+        self.ambitious_input.setValidator(validator)
         ambitious_layout.addWidget(ambitious_label)
         ambitious_layout.addWidget(self.ambitious_input)
         layout.addLayout(ambitious_layout)
@@ -109,7 +133,7 @@ class TaskDialog(QDialog):
         # Subtask parent field (hidden when no parent context)
         self.parent_layout = QHBoxLayout()
         self.parent_label = QLabel("Parent:")
-        self.parent_label.setFixedWidth(80)
+        self.parent_label.setObjectName("fieldLabel")
         self.parent_input = QLineEdit()
         self.parent_input.setPlaceholderText("none")
         self.parent_layout.addWidget(self.parent_label)
@@ -135,29 +159,30 @@ class TaskDialog(QDialog):
 
         self.setLayout(layout)
 
-    def keyPressEvent(self, event: QKeyEvent):
-        """Handle keyboard events."""
-        key = event.key()
-
-        if key == Qt.Key.Key_Return or key == Qt.Key.Key_Enter:
-            # Submit the task
-            self._submit()
-        elif key == Qt.Key.Key_Escape:
-            # Cancel
-            self.reject()
-        else:
-            # Default handling
-            super().keyPressEvent(event)
+        # Enter submits, Escape cancels (dispatched by Qt's shortcut map)
+        for key, slot in (
+            (Qt.Key.Key_Return, self._submit),
+            (Qt.Key.Key_Enter, self._submit),
+            (Qt.Key.Key_Escape, self.reject),
+        ):
+            QShortcut(QKeySequence(key), self, activated=slot)
 
     def showEvent(self, event):
         """Called when dialog is shown."""
         super().showEvent(event)
 
-        # Center on screen
-        screen = self.screen().availableGeometry()
-        x = (screen.width() - self.width()) // 2
-        y = (screen.height() - self.height()) // 2
-        self.move(x, y)
+        # Center on screen (recomputed only when the screen or dialog size changes,
+        # e.g. the parent row was shown or hidden)
+        key = (self.screen(), self.size())
+        if key != self._center_key:
+            screen = key[0].availableGeometry()
+            self._center_pos = QPoint(
+                (screen.width() - self.width()) // 2,
+                (screen.height() - self.height()) // 2,
+            )
+            self._center_key = key
+        if self.pos() != self._center_pos:
+            self.move(self._center_pos)
 
         # Focus on name input
         self.name_input.setFocus()
@@ -178,23 +203,10 @@ class TaskDialog(QDialog):
             print("ERROR: Timer length must be > 0 minutes")
             return
 
-        # Parse ambitious time (empty string = None/0)
+        # Parse ambitious time (empty string = None/0); the validator only
+        # admits non-negative integers
         ambitious_text = self.ambitious_input.text().strip()
-        if ambitious_text == "":
-            ambitious_minutes = 0
-        else:
-            try:
-                ambitious_minutes = int(ambitious_text)
-            except ValueError:
-                self.error_label.setText("Ambitious time must be a number")
-                self.error_label.setVisible(True)
-                print(f"ERROR: Invalid ambitious time: '{ambitious_text}'")
-                return
-
-            if ambitious_minutes < 0:
-                self.error_label.setText("Ambitious time must be positive")
-                self.error_label.setVisible(True)
-                return
+        ambitious_minutes = int(ambitious_text) if ambitious_text else 0
 
         # Validate ambitious <= estimated (when ambitious is set)
         if ambitious_minutes > 0 and ambitious_minutes > minutes:
@@ -207,14 +219,12 @@ class TaskDialog(QDialog):
 
         # Determine parent task ID (non-empty parent field = subtask)
         parent_id = self._parent_task_id if self.parent_input.text().strip() else ""
-        print(f"TaskDialog submitting: name='{name}', minutes={minutes}, ambitious={ambitious_minutes}, parent={parent_id or 'none'}")
 
         # Emit signal (ambitious_minutes=0 means None, parent_id="" means top-level)
         self.task_submitted.emit(name, minutes, ambitious_minutes, parent_id)
 
         # Close dialog
         self.accept()
-        print("TaskDialog closed")
 
     def set_parent_context(self, parent_name: str, parent_task_id: str) -> None:
         """Set the parent task context for the subtask field."""
@@ -231,6 +241,7 @@ class TaskDialog(QDialog):
         self.name_input.clear()
         self.time_input.setValue(DEFAULT_TASK_MINUTES)
         self.ambitious_input.clear()
+        self.error_label.clear()
         self.error_label.setVisible(False)
         self.parent_input.clear()
         self.parent_container.setVisible(False)
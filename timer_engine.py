@@ -1,45 +1,53 @@
 """Timer engine with alarm checking for etime application."""
 
+import time
 from typing import Optional, List
-from PyQt6.QtCore import QTimer, QObject, pyqtSignal
+from PyQt6.QtCore import Qt, QTimer, QObject, pyqtSignal
 
 from models import Task, TaskState
-from config import TIMER_INTERVAL_MS, TIMER_INCREMENT_S
+from config import TIMER_INTERVAL_MS
+
+# Wake this long after a second boundary so int(elapsed) has already advanced
+_BOUNDARY_SLACK_MS = 5
 
 
 def check_alarm(task: Task) -> Optional[int]:
     """
     Check if task should trigger an alarm.
 
+    TimerEngine._on_tick applies the same rule inline; keep the two in sync.
+
     Args:
         task: Task to check.
 
     Returns:
         Alarm level (1 for overtime, 2 for 2x, 3 for 3x, etc.) or None.
     """
-    if task.state != TaskState.ONGOING:
+    if task.state is not TaskState.ONGOING or task.estimated_seconds <= 0:
         return None
 
-    if task.estimated_seconds <= 0:
-        return None
-
-    ratio = task.elapsed_seconds / task.estimated_seconds
-
     # Determine current level: 1 = overtime, 2 = 2x, 3 = 3x, etc.
-    if ratio >= 1.0:
-        current_level = max(1, int(ratio))
-        if current_level > task.last_alarm_level:
-            return current_level
+    current_level = int(task.elapsed_seconds // task.estimated_seconds)
+    if current_level >= 1 and current_level > task.last_alarm_level:
+        return current_level
 
     return None
 
 
 class TimerEngine(QObject):
-    """Timer engine that updates task elapsed times and checks for alarms."""
+    """Timer engine that updates task elapsed times and checks for alarms.
+
+    Elapsed time is derived from interval timestamps, so ticks only need to
+    happen when something visible can change: each wake-up is scheduled for
+    the next whole-second boundary of any ongoing task (alarm thresholds are
+    whole seconds too). With nothing running the engine sleeps until
+    invalidate() reports a state change.
+    """
 
     # Signals
-    tick = pyqtSignal()  # Emitted on every timer tick
+    tick = pyqtSignal()  # Emitted when a displayed second changes
     alarm = pyqtSignal(str, int)  # Emitted when alarm triggers (task_id, level)
+    alarms_fired = pyqtSignal(list)  # All alarms of one tick: [(task_id, level), ...]
 
     def __init__(self, tasks: List[Task]):
         """
@@ -50,32 +58,82 @@ class TimerEngine(QObject):
         """
         super().__init__()
         self.tasks = tasks
+        self._ongoing: Optional[List[Task]] = None  # ONGOING subset; None = stale
+        self._running = False  # Between start() and stop()
         self.timer = QTimer()
-        self.timer.timeout.connect(self._on_tick)
-        self.timer.setInterval(TIMER_INTERVAL_MS)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        # The timer lives on this object's thread, so dispatch directly
+        self.timer.timeout.connect(self._on_tick, Qt.ConnectionType.DirectConnection)
 
     def start(self) -> None:
         """Start the timer."""
-        self.timer.start()
+        self._running = True
+        self.timer.start(0)
 
     def stop(self) -> None:
         """Stop the timer."""
+        self._running = False
         self.timer.stop()
 
+    def invalidate(self) -> None:
+        """Mark the ongoing-task cache stale (after a state or task list change)."""
+        self._ongoing = None
+        # Re-plan the next wake-up around the new set of running tasks (this
+        # also wakes an idle engine when a task starts)
+        if self._running:
+            self.timer.start(0)
+
+    def ongoing_tasks(self) -> List[Task]:
+        """Return the ONGOING tasks, rebuilding the cache if it is stale."""
+        if self._ongoing is None:
+            ongoing = TaskState.ONGOING
+            self._ongoing = [t for t in self.tasks if t.state is ongoing]
+        return self._ongoing
+
     def _on_tick(self) -> None:
         """Handle timer tick: update elapsed times and check alarms."""
-        # Update elapsed time for all ONGOING tasks
-        for task in self.tasks:
-            if task.state == TaskState.ONGOING:
-                task.elapsed_seconds = task.compute_elapsed()
-
-                # Check if alarm should trigger
-                alarm_level = check_alarm(task)
-                if alarm_level is not None:
+        # Update elapsed time for all ONGOING tasks (one clock read per tick).
+        # The alarm check is inlined here (see check_alarm) to keep this loop
+        # free of per-task function calls.
+        now = time.time()
+        second_changed = False
+        fired = []
+        alarm_emit = self.alarm.emit  # Bound once for the loop
+        for task in self.ongoing_tasks():
+            elapsed = task.compute_elapsed(now)
+            if int(elapsed) != int(task.elapsed_seconds):
+                second_changed = True
+            task.elapsed_seconds = elapsed
+
+            # Check if alarm should trigger
+            estimated = task.estimated_seconds
+            if estimated > 0:
+                level = int(elapsed // estimated)
+                if level >= 1 and level > task.last_alarm_level:
                     # Update last alarm level
-                    task.last_alarm_level = alarm_level
+                    task.last_alarm_level = level
                     # Emit alarm signal
-                    self.alarm.emit(task.id, alarm_level)
-
-        # Emit tick signal for UI updates
-        self.tick.emit()
+                    alarm_emit(task.id, level)
+                    fired.append((task.id, level))
+
+        # One batched emit so listeners handle simultaneous alarms (e.g. after
+        # wake from sleep) in a single pass
+        if fired:
+            self.alarms_fired.emit(fired)
+
+        # Emit tick signal for UI updates only when a shown (whole-second) value moved
+        if second_changed:
+            self.tick.emit()
+
+        self._schedule_next()
+
+    def _schedule_next(self) -> None:
+        """Sleep until the next second boundary of any ongoing task."""
+        ongoing = self.ongoing_tasks()
+        if not ongoing:
+            return  # Idle: invalidate() restarts the timer
+        delay = TIMER_INTERVAL_MS / 1000
+        for task in ongoing:
+            delay = min(delay, 1.0 - task.elapsed_seconds % 1.0)
+        self.timer.start(int(delay * 1000) + _BOUNDARY_SLACK_MS)